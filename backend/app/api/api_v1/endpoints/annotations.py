@@ -6,7 +6,6 @@ from typing import Any, List
 from app.api import deps
 from app.core.rate_limiter import RATE_LIMITS, limiter
 from app.models.annotation import Annotation, BoundingBox
-from app.models.project import Project
 from app.models.recording import Recording
 from app.models.user import User
 from app.schemas.annotation import Annotation as AnnotationSchema
@@ -65,11 +64,16 @@ def create_annotation(
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    recording = db.query(Recording).filter(Recording.id == recording_id).first()
+    recording = (
+        db.query(Recording)
+        .options(joinedload(Recording.project))
+        .filter(Recording.id == recording_id)
+        .first()
+    )
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    project = db.query(Project).filter(Project.id == recording.project_id).first()
+    project = recording.project
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
@@ -129,11 +133,16 @@ def read_annotations(
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    recording = db.query(Recording).filter(Recording.id == recording_id).first()
+    recording = (
+        db.query(Recording)
+        .options(joinedload(Recording.project))
+        .filter(Recording.id == recording_id)
+        .first()
+    )
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    project = db.query(Project).filter(Project.id == recording.project_id).first()
+    project = recording.project
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
@@ -6,15 +6,15 @@ from typing import Any, List
 from app.api import deps
 from app.core.config import settings
 from app.core.rate_limiter import RATE_LIMITS, limiter
+from app.models.annotation import Annotation
 from app.models.project import Project
 from app.models.recording import Recording
-from app.models.spectrogram import Spectrogram
 from app.models.user import User
 from app.schemas.project import Project as ProjectSchema
 from app.schemas.project import ProjectCreate, ProjectUpdate
 from app.services.minio_client import minio_client
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -125,8 +125,18 @@ def delete_project(
 
     logger.info(f"Deleting project {project_id} and all associated data")
 
-    # Get all recordings for this project to delete their files
-    recordings = db.query(Recording).filter(Recording.project_id == project_id).all()
+    # Get all recordings for this project to delete their files. Spectrograms and the
+    # rows the delete cascade walks are loaded with one IN query per level rather than
+    # lazily per recording and annotation.
+    recordings = (
+        db.query(Recording)
+        .options(
+            selectinload(Recording.spectrograms),
+            selectinload(Recording.annotations).selectinload(Annotation.bounding_boxes),
+        )
+        .filter(Recording.project_id == project_id)
+        .all()
+    )
 
     # Delete all MinIO files for recordings
     for recording in recordings:
@@ -140,10 +150,8 @@ def delete_project(
             logger.error(f"Failed to delete audio file {recording.file_path}: {str(e)}")
             # Continue even if file deletion fails
 
-        # Get and delete spectrograms for this recording
-        spectrograms = db.query(Spectrogram).filter(Spectrogram.recording_id == recording.id).all()
-
-        for spectrogram in spectrograms:
+        # Delete spectrograms for this recording
+        for spectrogram in recording.spectrograms:
             try:
                 # Delete the spectrogram image from MinIO
                 minio_client.delete_file(
@@ -5,6 +5,7 @@ import os
 import tempfile
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, List, Optional
@@ -23,9 +24,9 @@ from app.services.audio_service import audio_service
 from app.services.cache_service import cache_service
 from app.services.minio_client import minio_client
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
 from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 # Set cache directory for numba/librosa to avoid permission issues in Docker
 os.environ["NUMBA_CACHE_DIR"] = "/tmp"
@@ -166,7 +167,7 @@ async def upload_recording(
     # Extract audio metadata using centralized service
     audio_analysis_start = time.time()
     try:
-        audio_metadata = audio_service.extract_audio_metadata(contents, file_extension)
+        audio_metadata = audio_service.extract_audio_metadata_from_bytes(contents, file_extension)
         duration = audio_metadata.duration
         sr = audio_metadata.sample_rate
         logger.info(
@@ -238,6 +239,17 @@ def read_recordings(
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
+    # Collapse parameter values the query treats identically (unknown sort fields fall
+    # back to created_at, anything but "asc" sorts descending, an empty search or an
+    # unknown status filters nothing) so equivalent requests share one cache entry
+    search = search or None
+    if annotation_status not in ("annotated", "unannotated"):
+        annotation_status = None
+    if sort_by not in ("filename", "duration"):
+        sort_by = "created_at"
+    if sort_order != "asc":
+        sort_order = "desc"
+
     # Try to get from cache first
     cached_data = cache_service.get_project_recordings(
         project_id=project_id,
@@ -392,11 +404,16 @@ def read_recording(
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    recording = db.query(Recording).filter(Recording.id == recording_id).first()
+    recording = (
+        db.query(Recording)
+        .options(joinedload(Recording.project))
+        .filter(Recording.id == recording_id)
+        .first()
+    )
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    project = db.query(Project).filter(Project.id == recording.project_id).first()
+    project = recording.project
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
@@ -411,11 +428,16 @@ def delete_recording(
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    recording = db.query(Recording).filter(Recording.id == recording_id).first()
+    recording = (
+        db.query(Recording)
+        .options(joinedload(Recording.project))
+        .filter(Recording.id == recording_id)
+        .first()
+    )
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    project = db.query(Project).filter(Project.id == recording.project_id).first()
+    project = recording.project
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
@@ -449,8 +471,14 @@ def bulk_delete_recordings(
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
+    # Load everything the delete cascade touches up front: one IN query per level
+    # instead of lazy loads for every recording and annotation.
     recordings = (
         db.query(Recording)
+        .options(
+            selectinload(Recording.spectrograms),
+            selectinload(Recording.annotations).selectinload(Annotation.bounding_boxes),
+        )
         .filter(Recording.id.in_(recording_ids), Recording.project_id == project_id)
         .all()
     )
@@ -480,19 +508,27 @@ async def get_recording_audio(
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Stream audio file for a recording."""
-    recording = db.query(Recording).filter(Recording.id == recording_id).first()
+    recording = (
+        db.query(Recording)
+        .options(joinedload(Recording.project))
+        .filter(Recording.id == recording_id)
+        .first()
+    )
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    project = db.query(Project).filter(Project.id == recording.project_id).first()
+    project = recording.project
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    try:
-        audio_data = minio_client.get_file(
-            bucket_name=settings.MINIO_BUCKET_RECORDINGS, object_name=recording.file_path
-        )
+    # The stored object never changes (uploads get a fresh UUID filename), so a
+    # matching validator means the client's copy is current and MinIO can be skipped
+    etag = f'"{recording.id}-{recording.filename}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=31536000, immutable"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
 
+    try:
         # Determine content type based on file extension
         ext = os.path.splitext(recording.filename)[1].lower()
         content_type_map = {
@@ -503,10 +539,33 @@ async def get_recording_audio(
         }
         content_type = content_type_map.get(ext, "audio/mpeg")
 
+        # Let MinIO serve the bytes directly when it is reachable from the browser
+        if settings.MINIO_PUBLIC_ENDPOINT:
+            url = minio_client.get_presigned_url(
+                settings.MINIO_BUCKET_RECORDINGS,
+                recording.file_path,
+                expiry=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                response_headers={
+                    "response-content-type": content_type,
+                    "response-content-disposition": (
+                        f"inline; filename={recording.original_filename}"
+                    ),
+                },
+            )
+            if url:
+                return RedirectResponse(url, status_code=307)
+
+        audio_data = minio_client.stream_file(
+            bucket_name=settings.MINIO_BUCKET_RECORDINGS, object_name=recording.file_path
+        )
+
         return StreamingResponse(
             audio_data,
             media_type=content_type,
-            headers={"Content-Disposition": f"inline; filename={recording.original_filename}"},
+            headers={
+                "Content-Disposition": f"inline; filename={recording.original_filename}",
+                **cache_headers,
+            },
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve audio: {str(e)}")
@@ -521,11 +580,16 @@ def get_spectrogram_status(
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Get spectrogram generation status for a recording."""
-    recording = db.query(Recording).filter(Recording.id == recording_id).first()
+    recording = (
+        db.query(Recording)
+        .options(joinedload(Recording.project))
+        .filter(Recording.id == recording_id)
+        .first()
+    )
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    project = db.query(Project).filter(Project.id == recording.project_id).first()
+    project = recording.project
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
@@ -559,11 +623,16 @@ async def get_recording_spectrogram(
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Get spectrogram for a recording with proper cache validation."""
-    recording = db.query(Recording).filter(Recording.id == recording_id).first()
+    recording = (
+        db.query(Recording)
+        .options(joinedload(Recording.project))
+        .filter(Recording.id == recording_id)
+        .first()
+    )
     if not recording:
         raise HTTPException(status_code=404, detail="Recording not found")
 
-    project = db.query(Project).filter(Project.id == recording.project_id).first()
+    project = recording.project
     if not current_user.is_admin and project.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
@@ -622,7 +691,7 @@ async def get_recording_spectrogram(
 
     # Serve the spectrogram image
     try:
-        spectrogram_data = minio_client.get_file(
+        spectrogram_data = minio_client.stream_file(
             bucket_name=settings.MINIO_BUCKET_SPECTROGRAMS, object_name=image_path
         )
 
@@ -641,6 +710,26 @@ async def get_recording_spectrogram(
         raise HTTPException(status_code=500, detail=f"Failed to retrieve spectrogram: {str(e)}")
 
 
+def _extract_recording_metadata(file_path: str, filename: str):
+    """Download a recording from MinIO and analyze it for duration and sample rate."""
+    audio_data = minio_client.get_file(
+        bucket_name=settings.MINIO_BUCKET_RECORDINGS, object_name=file_path
+    )
+
+    with tempfile.NamedTemporaryFile(
+        delete=False, suffix=os.path.splitext(filename)[1]
+    ) as temp_file:
+        for chunk in audio_data:
+            temp_file.write(chunk)
+        temp_path = temp_file.name
+
+    try:
+        return audio_service.extract_audio_metadata(temp_path)
+    finally:
+        # Clean up temporary file
+        os.unlink(temp_path)
+
+
 @router.post("/backfill-durations")
 @limiter.limit(RATE_LIMITS["bulk_operation"])
 def backfill_missing_durations(
@@ -667,54 +756,37 @@ def backfill_missing_durations(
     failed_count = 0
     errors = []
 
-    for recording in recordings_missing_duration:
-        try:
-            # Download audio file from MinIO
-            audio_data = minio_client.get_file(
-                bucket_name=settings.MINIO_BUCKET_RECORDINGS, object_name=recording.file_path
-            )
-
-            # Create temporary file
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=os.path.splitext(recording.filename)[1]
-            ) as temp_file:
-                for chunk in audio_data:
-                    temp_file.write(chunk)
-                temp_path = temp_file.name
-
+    # Download and decode recordings in parallel; both mostly wait on MinIO or run in
+    # native decoders. The session is not thread-safe, so rows are updated here.
+    with ThreadPoolExecutor(max_workers=settings.BACKFILL_MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                _extract_recording_metadata, recording.file_path, recording.filename
+            ): recording
+            for recording in recordings_missing_duration
+        }
+        for future in as_completed(futures):
+            recording = futures[future]
             try:
-                # Analyze audio to get duration using AudioService
-                audio_metadata = audio_service.extract_audio_metadata(
-                    open(temp_path, "rb").read(), os.path.splitext(recording.filename)[1]
-                )
-
-                # Update recording with duration and sample rate if missing
-                recording.duration = audio_metadata.duration
-                if recording.sample_rate is None:
-                    recording.sample_rate = audio_metadata.sample_rate
-
-                db.commit()
-                updated_count += 1
-
-                logger.info(
-                    f"Updated recording {recording.id} - Duration: {audio_metadata.duration:.2f}s, "
-                    f"Sample Rate: {audio_metadata.sample_rate}"
-                )
-
+                audio_metadata = future.result()
             except Exception as e:
-                logger.error(f"Failed to analyze audio for recording {recording.id}: {str(e)}")
+                logger.error(f"Failed to process recording {recording.id}: {str(e)}")
                 errors.append(f"Recording {recording.id}: {str(e)}")
                 failed_count += 1
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_path)
-
-        except Exception as e:
-            logger.error(f"Failed to process recording {recording.id}: {str(e)}")
-            errors.append(f"Recording {recording.id}: {str(e)}")
-            failed_count += 1
+                continue
+
+            # Update recording with duration and sample rate if missing
+            recording.duration = audio_metadata.duration
+            if recording.sample_rate is None:
+                recording.sample_rate = audio_metadata.sample_rate
+            updated_count += 1
+
+            logger.info(
+                f"Updated recording {recording.id} - Duration: {audio_metadata.duration:.2f}s, "
+                f"Sample Rate: {audio_metadata.sample_rate}"
+            )
+
+    db.commit()
 
     result = {
         "message": f"Processed {len(recordings_missing_duration)} recordings",
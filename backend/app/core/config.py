@@ -2,7 +2,7 @@
 
 import re
 import warnings
-from typing import List
+from typing import List, Optional
 
 from pydantic import ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings
@@ -37,6 +37,13 @@ class Settings(BaseSettings):
     MINIO_SECURE: bool = False
     MINIO_BUCKET_RECORDINGS: str = "recordings"
     MINIO_BUCKET_SPECTROGRAMS: str = "spectrograms"
+    MINIO_PUBLIC_ENDPOINT: Optional[str] = Field(
+        default=None,
+        description="Browser-reachable MinIO host; when set, audio is served by presigned redirect",
+    )
+    MINIO_REGION: str = Field(
+        default="us-east-1", description="Region presigned URLs are signed for"
+    )
 
     # CORS Settings - Environment-specific
     CORS_ORIGINS: List[str] = Field(
@@ -51,11 +58,21 @@ class Settings(BaseSettings):
     # File Upload Settings
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024
     ALLOWED_AUDIO_EXTENSIONS: List[str] = [".mp3", ".wav", ".m4a", ".flac"]
+    BACKFILL_MAX_WORKERS: int = Field(
+        default=4, description="Recordings downloaded and analyzed in parallel during backfill"
+    )
 
     # Spectrogram Generation Settings
     SPECTROGRAM_N_FFT: int = 2048
     SPECTROGRAM_HOP_LENGTH: int = 512
     SPECTROGRAM_N_MELS: int = 128
+    SPECTROGRAM_USE_GPU: bool = Field(
+        default=True, description="Compute the STFT on CUDA when torch and a GPU are available"
+    )
+    SPECTROGRAM_FFT_WORKERS: int = Field(
+        default=-1,
+        description="Threads scipy.fft uses per STFT; -1 uses all cores, 1 disables threading",
+    )
 
     @field_validator("SECRET_KEY")
     @classmethod
@@ -1,4 +1,3 @@
-import io
 import logging
 from typing import Optional
 
@@ -17,8 +16,9 @@ from app.services.minio_client import minio_client
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from minio.error import S3Error
 from slowapi.errors import RateLimitExceeded
 from starlette.datastructures import MutableHeaders
 
@@ -29,6 +29,8 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # orjson serializes the large recording/annotation listings several times faster
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiter to app state
@@ -156,6 +158,36 @@ async def verify_token(
         raise HTTPException(status_code=403, detail="No authentication provided")
 
 
+def _serve_minio_file(
+    request: Request,
+    bucket_name: str,
+    file_path: str,
+    media_type: str,
+    cache_control: str,
+    not_found_detail: str,
+) -> Response:
+    """
+    Stream a MinIO object, answering conditional GETs without downloading it.
+
+    The object's MinIO ETag is used as the HTTP ETag, so a matching If-None-Match
+    costs a single stat call and returns 304.
+    """
+    stat = minio_client.stat_file(bucket_name, file_path)
+    if stat is None:
+        raise HTTPException(status_code=404, detail=not_found_detail)
+
+    headers = {"ETag": f'"{stat.etag}"', "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        body = minio_client.stream_file(bucket_name, file_path)
+    except S3Error:
+        # Removed between the stat and the GET
+        raise HTTPException(status_code=404, detail=not_found_detail)
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
 @app.get("/files/recordings/{file_path:path}")
 @limiter.limit(get_rate_limit("file_serve"))
 async def get_audio_file(
@@ -166,11 +198,15 @@ async def get_audio_file(
 ):
     await verify_token(token, authorization)
     try:
-        audio_data = minio_client.download_file(settings.MINIO_BUCKET_RECORDINGS, file_path)
-        if audio_data:
-            return StreamingResponse(io.BytesIO(audio_data), media_type="audio/mpeg")
-        else:
-            raise HTTPException(status_code=404, detail="Audio file not found")
+        # Uploads get a fresh UUID object name, so the bytes behind a path never change
+        return _serve_minio_file(
+            request,
+            settings.MINIO_BUCKET_RECORDINGS,
+            file_path,
+            media_type="audio/mpeg",
+            cache_control="private, max-age=31536000, immutable",
+            not_found_detail="Audio file not found",
+        )
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -187,11 +223,15 @@ async def get_spectrogram_file(
 ):
     await verify_token(token, authorization)
     try:
-        image_data = minio_client.download_file(settings.MINIO_BUCKET_SPECTROGRAMS, file_path)
-        if image_data:
-            return StreamingResponse(io.BytesIO(image_data), media_type="image/png")
-        else:
-            raise HTTPException(status_code=404, detail="Spectrogram not found")
+        # Regeneration overwrites the same object, so clients must revalidate
+        return _serve_minio_file(
+            request,
+            settings.MINIO_BUCKET_SPECTROGRAMS,
+            file_path,
+            media_type="image/png",
+            cache_control="private, no-cache",
+            not_found_detail="Spectrogram not found",
+        )
     except Exception as e:
         if isinstance(e, HTTPException):
             raise e
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 
 from app.db.base_class import Base
 from sqlalchemy import JSON, Column, DateTime, Enum, Float, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 if TYPE_CHECKING:
@@ -36,8 +36,8 @@ class Spectrogram(Base):
     # Legacy compatibility
     image_path = Column(String, nullable=True)  # Points to standard_path for backward compatibility
 
-    # Metadata
-    parameters = Column(JSON, nullable=True)
+    # Metadata (JSON blob is write-mostly, so keep it out of the default SELECT)
+    parameters = deferred(Column(JSON, nullable=True))
     width = Column(Integer, nullable=True)
     height = Column(Integer, nullable=True)
 
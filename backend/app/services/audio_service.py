@@ -1,5 +1,6 @@
 """Audio processing service for extracting metadata from audio files."""
 
+import io
 import logging
 import os
 import tempfile
@@ -8,6 +9,7 @@ from typing import Dict, Optional, Tuple, Union
 
 import librosa
 import numpy as np
+import soundfile as sf
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +109,22 @@ class AudioService:
         Raises:
             AudioProcessingError: If data cannot be processed
         """
+        # Uncompressed and lossless containers record the exact frame count in their
+        # header, so read it straight from memory instead of spilling the bytes to disk
+        # and decoding them. MPEG frame counts can be estimates, so MP3 is decoded.
+        try:
+            info = sf.info(io.BytesIO(audio_data))
+        except RuntimeError:
+            info = None
+        if info is not None and info.format != "MPEG" and info.frames > 0:
+            # Report mono like the librosa path: recordings are analyzed as a mixed-down
+            # single channel whatever the file stores
+            return AudioMetadata(
+                duration=info.frames / info.samplerate,
+                sample_rate=int(info.samplerate),
+                channels=1,
+            )
+
         try:
             # Create temporary file with the audio data
             with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as temp_file:
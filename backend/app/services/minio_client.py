@@ -1,6 +1,8 @@
 import logging
 import time
+from datetime import timedelta
 from io import BytesIO
+from typing import Dict, Optional
 
 from app.core.config import settings
 from minio import Minio
@@ -25,19 +27,41 @@ class MinioClient:
                 secure=settings.MINIO_SECURE,
             )
             logger.info(f"MinIO client created for endpoint: {settings.MINIO_ENDPOINT}")
+
+            # Presigned URLs embed the host they were signed for, so sign them with a
+            # client pointed at the public endpoint. The region is configured so signing
+            # never has to ask the server for it.
+            self.public_client = None
+            if settings.MINIO_PUBLIC_ENDPOINT:
+                self.public_client = Minio(
+                    settings.MINIO_PUBLIC_ENDPOINT,
+                    access_key=settings.MINIO_ACCESS_KEY,
+                    secret_key=settings.MINIO_SECRET_KEY,
+                    secure=settings.MINIO_SECURE,
+                    region=settings.MINIO_REGION,
+                )
         except Exception as e:
             logger.error(f"Error creating MinIO client: {e}")
             raise
 
     def _ensure_buckets(self):
+        # Buckets confirmed to exist; lets upload_file skip its bucket_exists round trip
+        self._known_buckets = set()
         buckets = [settings.MINIO_BUCKET_RECORDINGS, settings.MINIO_BUCKET_SPECTROGRAMS]
+        try:
+            # One listing answers existence for every bucket instead of a HEAD per bucket
+            existing = {bucket.name for bucket in self.client.list_buckets()}
+        except Exception as e:
+            logger.error(f"Error listing buckets: {e}")
+            return
         for bucket in buckets:
             try:
-                if not self.client.bucket_exists(bucket):
+                if bucket not in existing:
                     self.client.make_bucket(bucket)
                     logger.info(f"Created bucket: {bucket}")
                 else:
                     logger.debug(f"Bucket already exists: {bucket}")
+                self._known_buckets.add(bucket)
             except S3Error as e:
                 logger.error(f"Error creating bucket {bucket}: {e}")
             except Exception as e:
@@ -54,9 +78,11 @@ class MinioClient:
         for attempt in range(max_retries):
             try:
                 # Ensure bucket exists before uploading
-                if not self.client.bucket_exists(bucket_name):
-                    self.client.make_bucket(bucket_name)
-                    logger.info(f"Created missing bucket during upload: {bucket_name}")
+                if bucket_name not in self._known_buckets:
+                    if not self.client.bucket_exists(bucket_name):
+                        self.client.make_bucket(bucket_name)
+                        logger.info(f"Created missing bucket during upload: {bucket_name}")
+                    self._known_buckets.add(bucket_name)
 
                 self.client.put_object(
                     bucket_name,
@@ -82,6 +108,10 @@ class MinioClient:
                 else:
                     raise
             except S3Error as e:
+                if e.code == "NoSuchBucket" and attempt < max_retries - 1:
+                    # Bucket was removed behind our back; recreate it on the next attempt
+                    self._known_buckets.discard(bucket_name)
+                    continue
                 logger.error(f"S3 Error uploading file {object_name}: {e}")
                 raise
             except Exception as e:
@@ -99,6 +129,14 @@ class MinioClient:
             logger.error(f"Error downloading file: {e}")
             return None
 
+    def stat_file(self, bucket_name: str, object_name: str):
+        """Return object metadata (etag, size, last_modified) without downloading it."""
+        try:
+            return self.client.stat_object(bucket_name, object_name)
+        except S3Error as e:
+            logger.error(f"Error getting file metadata: {e}")
+            return None
+
     def delete_file(self, bucket_name: str, object_name: str):
         try:
             self.client.remove_object(bucket_name, object_name)
@@ -116,9 +154,44 @@ class MinioClient:
             logger.error(f"Error getting file: {e}")
             raise
 
-    def get_presigned_url(self, bucket_name: str, object_name: str, expiry: int = 3600):
+    def stream_file(self, bucket_name: str, object_name: str, chunk_size: int = 64 * 1024):
+        """
+        Open an object and return an iterator over its chunks for StreamingResponse.
+
+        The GET is issued immediately, so a missing object raises here rather than after
+        the response headers are sent; the body is then relayed chunk by chunk instead
+        of being buffered whole.
+        """
         try:
-            return self.client.presigned_get_object(bucket_name, object_name, expires=expiry)
+            response = self.client.get_object(bucket_name, object_name)
+        except S3Error as e:
+            logger.error(f"Error getting file: {e}")
+            raise
+
+        def chunks():
+            try:
+                yield from response.stream(chunk_size)
+            finally:
+                response.close()
+                response.release_conn()
+
+        return chunks()
+
+    def get_presigned_url(
+        self,
+        bucket_name: str,
+        object_name: str,
+        expiry: int = 3600,
+        response_headers: Optional[Dict[str, str]] = None,
+    ):
+        client = self.public_client or self.client
+        try:
+            return client.presigned_get_object(
+                bucket_name,
+                object_name,
+                expires=timedelta(seconds=expiry),
+                response_headers=response_headers,
+            )
         except S3Error as e:
             logger.error(f"Error generating presigned URL: {e}")
             return None
@@ -0,0 +1,44 @@
+"""
+Numba kernels for spectrogram post-processing.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def normalize_db_to_uint8(S_db: np.ndarray) -> np.ndarray:
+    """
+    Scale a dB spectrogram to 0-255 and flip it vertically in a single pass.
+
+    Equivalent to ``np.flipud(((S - S.min()) / (S.max() - S.min()) * 255).astype(np.uint8))``
+    without the intermediate float arrays; rows are processed in parallel.
+
+    Args:
+        S_db: 2-D spectrogram in decibels (frequency bins x frames)
+
+    Returns:
+        uint8 array with low frequencies in the last row
+    """
+    n_rows, n_cols = S_db.shape
+    out = np.empty((n_rows, n_cols), dtype=np.uint8)
+    if S_db.size == 0:
+        return out
+
+    lo = S_db.min()
+    span = S_db.max() - lo
+
+    for i in prange(n_rows):
+        src = n_rows - 1 - i
+        for j in range(n_cols):
+            if span > 0:
+                out[i, j] = np.uint8((S_db[src, j] - lo) / span * 255)
+            else:
+                out[i, j] = 0
+    return out
+
+
+def warm_up_kernels() -> None:
+    """Compile the kernels for the dtypes the spectrogram task uses."""
+    for dtype in (np.float32, np.float64):
+        normalize_db_to_uint8(np.zeros((2, 2), dtype=dtype))
@@ -5,29 +5,177 @@ Celery tasks for spectrogram generation.
 import io
 import logging
 import os
+import shutil
 import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Optional, Tuple, Union
 
+import audioread
 import librosa
 import numpy as np
+import scipy.fft
+import scipy.signal
+import soundfile as sf
 from app.core.celery_app import celery_app
 from app.core.config import settings
 from app.db.session import SessionLocal
 from app.models import Recording, Spectrogram
 from app.models.spectrogram import SpectrogramStatus
 from app.services.minio_client import minio_client
+from app.tasks.spectrogram_kernels import normalize_db_to_uint8, warm_up_kernels
 from celery.exceptions import SoftTimeLimitExceeded
+from celery.signals import worker_init
 from matplotlib import cm
 from PIL import Image
 from sqlalchemy.orm import Session
 
+try:
+    import torch
+except ImportError:  # GPU STFT is optional; torch is not part of requirements.txt
+    torch = None
+
 # Set cache directory for numba/librosa to avoid permission issues in Docker
 os.environ["NUMBA_CACHE_DIR"] = "/tmp"
 
+# Probe audioread's decoders once at import. audioread>=3.0 caches the result, so
+# prefork children inherit it instead of re-probing on every librosa.load fallback.
+audioread.available_backends()
+
 logger = logging.getLogger(__name__)
 
+# Frames windowed and transformed per rfft call; bounds the complex scratch buffer
+# to a few MB regardless of recording length.
+STFT_BLOCK_FRAMES = 512
+
+
+@worker_init.connect
+def _warm_up_spectrogram_kernels(**kwargs) -> None:
+    """Compile numba kernels in the parent worker so forked children start warm."""
+    warm_up_kernels()
+
+
+def load_audio(source: Union[str, BinaryIO], suffix: str = "") -> Tuple[np.ndarray, int]:
+    """
+    Decode audio as mono float32 at its native sample rate.
+
+    Formats supported by libsndfile are read directly with soundfile, from a path or
+    straight from an in-memory buffer, which skips librosa's resampling and audioread
+    backend probing. Anything libsndfile cannot decode (e.g. M4A) falls back to
+    librosa; audioread needs a real file, so buffers are spilled to a temporary file
+    only in that case.
+
+    Args:
+        source: Path to the audio file, or a seekable binary file object
+        suffix: File extension hinting the format when spilling a buffer to disk
+
+    Returns:
+        Tuple of (audio time series, sample rate)
+    """
+    try:
+        y, sr = sf.read(source, dtype="float32", always_2d=False)
+    except RuntimeError as e:
+        logger.debug(f"soundfile could not decode audio ({e}), falling back to librosa")
+        if isinstance(source, str):
+            return librosa.load(source, sr=None)
+        source.seek(0)
+        with tempfile.NamedTemporaryFile(suffix=suffix) as temp_file:
+            shutil.copyfileobj(source, temp_file)
+            temp_file.flush()
+            return librosa.load(temp_file.name, sr=None)
+
+    # Downmix to mono to match librosa.load's default
+    if y.ndim > 1:
+        y = y.mean(axis=1)
+    return y, sr
+
+
+@lru_cache(maxsize=8)
+def _stft_window(n_fft: int) -> np.ndarray:
+    """Periodic Hann window, built once per FFT size for the worker's lifetime."""
+    window = scipy.signal.get_window("hann", n_fft, fftbins=True).astype(np.float32)
+    window.setflags(write=False)
+    return window
+
+
+@lru_cache(maxsize=1)
+def _viridis_lut() -> np.ndarray:
+    """
+    Viridis colormap as a (256, 3) uint8 RGB table, built once per worker.
+
+    Indexing it with the normalized uint8 spectrogram gives the same pixels as calling
+    the colormap, without materializing a float64 RGBA copy of the whole image.
+    """
+    lut = (cm.get_cmap("viridis")(np.arange(256))[:, :3] * 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=1)
+def _gpu_stft_available() -> bool:
+    """Return True when the STFT can run on a CUDA device."""
+    return settings.SPECTROGRAM_USE_GPU and torch is not None and torch.cuda.is_available()
+
+
+@lru_cache(maxsize=8)
+def _torch_stft_window(n_fft: int):
+    """Periodic Hann window kept resident on the GPU."""
+    return torch.hann_window(n_fft, periodic=True, device="cuda")
+
+
+def _compute_stft_magnitude_gpu(y: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """Compute the centered STFT magnitude with torch.stft on the GPU."""
+    signal = torch.from_numpy(np.ascontiguousarray(y, dtype=np.float32)).to("cuda")
+    spectrum = torch.stft(
+        signal,
+        n_fft=n_fft,
+        hop_length=hop_length,
+        window=_torch_stft_window(n_fft),
+        center=True,
+        pad_mode="constant",
+        return_complex=True,
+    )
+    return spectrum.abs().cpu().numpy()
+
+
+def compute_stft_magnitude(y: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """
+    Compute the STFT magnitude of a signal, matching librosa.stft's centered framing.
+
+    Frames are taken as a strided view of the zero-padded signal and transformed in
+    batched scipy.fft calls of STFT_BLOCK_FRAMES frames each, written straight into a
+    preallocated float32 output so long recordings never hold the full complex
+    spectrum. scipy.fft keeps FFT plans cached across tasks in the same worker process
+    and splits each block across SPECTROGRAM_FFT_WORKERS threads.
+    When torch with CUDA is installed, the STFT runs on the GPU instead, falling back
+    to the CPU path if the device call fails.
+
+    Args:
+        y: Audio time series
+        n_fft: FFT window size
+        hop_length: Number of samples between successive frames
+
+    Returns:
+        Magnitude array of shape (1 + n_fft // 2, n_frames)
+    """
+    if _gpu_stft_available():
+        try:
+            return _compute_stft_magnitude_gpu(y, n_fft, hop_length)
+        except RuntimeError as e:
+            logger.warning(f"GPU STFT failed, falling back to CPU: {e}")
+
+    padded = np.pad(y.astype(np.float32, copy=False), n_fft // 2, mode="constant")
+    frames = np.lib.stride_tricks.sliding_window_view(padded, n_fft)[::hop_length]
+    window = _stft_window(n_fft)
+
+    magnitude = np.empty((1 + n_fft // 2, len(frames)), dtype=np.float32)
+    for start in range(0, len(frames), STFT_BLOCK_FRAMES):
+        block = frames[start : start + STFT_BLOCK_FRAMES]
+        spectrum = scipy.fft.rfft(block * window, axis=-1, workers=settings.SPECTROGRAM_FFT_WORKERS)
+        np.abs(spectrum.T, out=magnitude[:, start : start + len(block)])
+    return magnitude
+
 
 def generate_spectrogram_image(
     y: np.ndarray,
@@ -60,8 +208,8 @@ def generate_spectrogram_image(
         hop_length = max(1, int(len(y) / target_width))
 
     # Generate STFT
-    D = librosa.stft(y, n_fft=n_fft, hop_length=hop_length)
-    S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)
+    S = compute_stft_magnitude(y, n_fft=n_fft, hop_length=hop_length)
+    S_db = librosa.amplitude_to_db(S, ref=np.max)
 
     # Limit frequency range based on max_frequency or Nyquist frequency
     if max_frequency is None:
@@ -74,30 +222,21 @@ def generate_spectrogram_image(
 
     logger.info(f"Using max frequency: {max_frequency} Hz (Nyquist: {sr // 2} Hz)")
 
-    # Normalize to 0-255
-    S_db_norm = S_db_limited - S_db_limited.min()
-    if S_db_norm.max() > 0:
-        S_db_norm = (S_db_norm / S_db_norm.max() * 255).astype(np.uint8)
-    else:
-        S_db_norm = S_db_norm.astype(np.uint8)
-
-    # Flip vertically so low frequencies are at bottom
-    S_db_norm = np.flipud(S_db_norm)
+    # Normalize to 0-255 and flip vertically so low frequencies are at bottom
+    S_db_norm = normalize_db_to_uint8(S_db_limited)
 
-    # Apply viridis colormap
-    viridis = cm.get_cmap("viridis")
-    colored = viridis(S_db_norm)
-    rgb_array = (colored[:, :, :3] * 255).astype(np.uint8)
+    # Apply viridis colormap as a single uint8 gather
+    rgb_array = _viridis_lut()[S_db_norm]
 
     # Create PIL image and resize to target dimensions
     img = Image.fromarray(rgb_array)
     img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
 
-    # Save to buffer
+    # Save to buffer. PNG is lossless at any level, so zlib level 1 only trades some file
+    # size for a much faster encode than optimize=True's maximum-effort search.
     buffer = io.BytesIO()
-    img.save(buffer, format="PNG", optimize=True)
-    buffer.seek(0)
-    return buffer.read()
+    img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
 
 
 @celery_app.task(bind=True, name="app.tasks.spectrogram_tasks.generate_spectrogram_task")
@@ -155,108 +294,102 @@ def generate_spectrogram_task(self, recording_id: int) -> Dict:
             bucket_name=settings.MINIO_BUCKET_RECORDINGS, object_name=recording.file_path
         )
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix=Path(recording.filename).suffix) as temp_file:
-            temp_file.write(audio_data.read())
-            temp_file.flush()
-
-            # Load audio
-            self.update_state(state="PROCESSING", meta={"stage": "loading_audio", "progress": 40})
-
-            y, sr = librosa.load(temp_file.name, sr=None)
-            duration = librosa.get_duration(y=y, sr=sr)
+        # Load audio
+        self.update_state(state="PROCESSING", meta={"stage": "loading_audio", "progress": 40})
 
-            # Update recording duration if missing
-            if recording.duration is None:
-                recording.duration = duration
-                logger.info(
-                    f"Updated missing duration for recording {recording.id}: {recording.duration:.2f}s"
-                )
-                db.commit()
-
-            # Calculate Nyquist frequency (maximum meaningful frequency)
-            nyquist_frequency = sr // 2
-
-            # Update recording sample rate if not already set
-            if recording.sample_rate != sr:
-                logger.info(f"Updating recording sample rate from {recording.sample_rate} to {sr}")
-                recording.sample_rate = sr
-                db.commit()
+        # Decode straight from the downloaded buffer; no temp file round-trip
+        y, sr = load_audio(audio_data, suffix=Path(recording.filename).suffix)
+        duration = len(y) / sr
 
+        # Update recording duration if missing
+        if recording.duration is None:
+            recording.duration = duration
             logger.info(
-                f"Audio loaded: {duration:.2f}s, Sample Rate: {sr} Hz, Nyquist: {nyquist_frequency} Hz"
+                f"Updated missing duration for recording {recording.id}: {recording.duration:.2f}s"
             )
+            db.commit()
 
-            # Calculate appropriate width based on duration
-            # Use 200 pixels per second for optimal resolution
-            base_width_per_second = 200
-            spectrogram_width = min(3200, max(800, int(duration * base_width_per_second)))
-            spectrogram_height = 400
-
-            # Generate spectrogram
-            self.update_state(
-                state="PROCESSING", meta={"stage": "generating_spectrogram", "progress": 60}
-            )
-            spectrogram_data = generate_spectrogram_image(
-                y,
-                sr,
-                spectrogram_width,
-                spectrogram_height,
-                n_fft=2048,
-                hop_length=512,
-                max_frequency=nyquist_frequency,
-            )
+        # Calculate Nyquist frequency (maximum meaningful frequency)
+        nyquist_frequency = sr // 2
 
-            # Upload spectrogram
-            self.update_state(
-                state="PROCESSING", meta={"stage": "uploading_spectrogram", "progress": 80}
-            )
-            spectrogram_path = f"spectrograms/{recording_id}/spectrogram.png"
-            minio_client.upload_file(
-                settings.MINIO_BUCKET_SPECTROGRAMS, spectrogram_path, spectrogram_data, "image/png"
-            )
+        # Update recording sample rate if not already set
+        if recording.sample_rate != sr:
+            logger.info(f"Updating recording sample rate from {recording.sample_rate} to {sr}")
+            recording.sample_rate = sr
+            db.commit()
 
-            # Update database record
-            self.update_state(
-                state="PROCESSING", meta={"stage": "updating_database", "progress": 90}
-            )
+        logger.info(
+            f"Audio loaded: {duration:.2f}s, Sample Rate: {sr} Hz, Nyquist: {nyquist_frequency} Hz"
+        )
 
-            processing_time = time.time() - task_start
-
-            spectrogram.status = SpectrogramStatus.COMPLETED
-            spectrogram.image_path = spectrogram_path
-            spectrogram.width = spectrogram_width
-            spectrogram.height = spectrogram_height
-            spectrogram.processing_time = processing_time
-            spectrogram.parameters = {
-                "n_fft": 2048,
-                "hop_length": 512,
-                "sample_rate": sr,
-                "max_frequency": nyquist_frequency,
-                "nyquist_frequency": nyquist_frequency,
-                "duration": duration,
-                "pixels_per_second": base_width_per_second,
-            }
+        # Calculate appropriate width based on duration
+        # Use 200 pixels per second for optimal resolution
+        base_width_per_second = 200
+        spectrogram_width = min(3200, max(800, int(duration * base_width_per_second)))
+        spectrogram_height = 400
 
-            # Clear multi-resolution paths if they exist
-            spectrogram.thumbnail_path = None
-            spectrogram.standard_path = None
-            spectrogram.full_path = None
+        # Generate spectrogram
+        self.update_state(
+            state="PROCESSING", meta={"stage": "generating_spectrogram", "progress": 60}
+        )
+        spectrogram_data = generate_spectrogram_image(
+            y,
+            sr,
+            spectrogram_width,
+            spectrogram_height,
+            n_fft=2048,
+            hop_length=512,
+            max_frequency=nyquist_frequency,
+        )
 
-            db.commit()
+        # Upload spectrogram
+        self.update_state(
+            state="PROCESSING", meta={"stage": "uploading_spectrogram", "progress": 80}
+        )
+        spectrogram_path = f"spectrograms/{recording_id}/spectrogram.png"
+        minio_client.upload_file(
+            settings.MINIO_BUCKET_SPECTROGRAMS, spectrogram_path, spectrogram_data, "image/png"
+        )
 
-            logger.info(
-                f"Spectrogram generation completed for recording {recording_id} in {processing_time:.2f}s"
-            )
+        # Update database record
+        self.update_state(state="PROCESSING", meta={"stage": "updating_database", "progress": 90})
+
+        processing_time = time.time() - task_start
+
+        spectrogram.status = SpectrogramStatus.COMPLETED
+        spectrogram.image_path = spectrogram_path
+        spectrogram.width = spectrogram_width
+        spectrogram.height = spectrogram_height
+        spectrogram.processing_time = processing_time
+        spectrogram.parameters = {
+            "n_fft": 2048,
+            "hop_length": 512,
+            "sample_rate": sr,
+            "max_frequency": nyquist_frequency,
+            "nyquist_frequency": nyquist_frequency,
+            "duration": duration,
+            "pixels_per_second": base_width_per_second,
+        }
+
+        # Clear multi-resolution paths if they exist
+        spectrogram.thumbnail_path = None
+        spectrogram.standard_path = None
+        spectrogram.full_path = None
+
+        db.commit()
+
+        logger.info(
+            f"Spectrogram generation completed for recording {recording_id} in {processing_time:.2f}s"
+        )
 
-            return {
-                "status": "success",
-                "recording_id": recording_id,
-                "processing_time": processing_time,
-                "path": spectrogram_path,
-                "width": spectrogram_width,
-                "height": spectrogram_height,
-            }
+        return {
+            "status": "success",
+            "recording_id": recording_id,
+            "processing_time": processing_time,
+            "path": spectrogram_path,
+            "width": spectrogram_width,
+            "height": spectrogram_height,
+        }
 
     except SoftTimeLimitExceeded:
         logger.error(f"Task timeout for recording {recording_id}")
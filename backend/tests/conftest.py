@@ -2,7 +2,7 @@
 
 import os
 import tempfile
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock, create_autospec
 
 import numpy as np
 import pytest
@@ -27,6 +27,7 @@ from app.models.project import Project
 from app.models.recording import Recording
 from app.models.spectrogram import Spectrogram
 from app.models.user import User
+from app.services.minio_client import MinioClient
 
 
 @pytest.fixture(scope="session")
@@ -54,8 +55,15 @@ def test_db(test_engine):
         Base.metadata.drop_all(bind=test_engine)
 
 
+@pytest.fixture(scope="session")
+def app_client():
+    """Create a single test client so app startup runs once per session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(test_db):
+def client(app_client, test_db):
     """Create test client with database override."""
 
     def override_get_db():
@@ -66,8 +74,7 @@ def client(test_db):
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
 
     app.dependency_overrides.clear()
 
@@ -150,6 +157,23 @@ def test_recording_no_duration(test_db, test_project):
     return recording
 
 
+@pytest.fixture
+def recording_factory(test_db, test_project):
+    """Bind RecordingFactory to the per-test session and the test project."""
+    from tests.factories import RecordingFactory
+
+    RecordingFactory._meta.sqlalchemy_session = test_db
+    RecordingFactory.reset_sequence()
+
+    def create_batch(size, **kwargs):
+        kwargs.setdefault("project_id", test_project.id)
+        recordings = RecordingFactory.create_batch(size, **kwargs)
+        test_db.commit()
+        return recordings
+
+    return create_batch
+
+
 @pytest.fixture
 def mock_librosa():
     """Mock librosa functions."""
@@ -177,12 +201,12 @@ def mock_librosa():
 @pytest.fixture
 def mock_minio_client():
     """Mock MinIO client."""
-    mock_client = MagicMock()
+    mock_client = create_autospec(MinioClient, instance=True)
 
-    # Mock file content (fake MP3 data)
-    fake_audio_content = b"fake mp3 content for testing"
-    mock_client.get_file.return_value = iter([fake_audio_content])
-    mock_client.put_file.return_value = True
+    # Mock file content (fake MP3 data); each call gets a fresh stream over one buffer
+    fake_audio_chunk = memoryview(b"fake mp3 content for testing")
+    mock_client.get_file.side_effect = lambda *args, **kwargs: iter((fake_audio_chunk,))
+    mock_client.upload_file.return_value = True
     mock_client.delete_file.return_value = True
 
     return mock_client
@@ -201,19 +225,29 @@ def temp_audio_file():
     os.unlink(tmp_file.name)
 
 
-@pytest.fixture
-def auth_headers(client, test_user):
-    """Create authentication headers for API requests."""
+@pytest.fixture(scope="session")
+def session_auth_headers():
+    """Return a getter that signs one JWT per subject for the whole test session."""
     from app.core.security import create_access_token
 
-    access_token = create_access_token(subject=test_user.email)
-    return {"Authorization": f"Bearer {access_token}"}
+    headers_by_subject = {}
+
+    def get_headers(subject):
+        if subject not in headers_by_subject:
+            access_token = create_access_token(subject=subject)
+            headers_by_subject[subject] = {"Authorization": f"Bearer {access_token}"}
+        return headers_by_subject[subject]
+
+    return get_headers
 
 
 @pytest.fixture
-def admin_auth_headers(client, admin_user):
-    """Create admin authentication headers for API requests."""
-    from app.core.security import create_access_token
+def auth_headers(client, test_user, session_auth_headers):
+    """Create authentication headers for API requests."""
+    return session_auth_headers(test_user.email)
 
-    access_token = create_access_token(subject=admin_user.email)
-    return {"Authorization": f"Bearer {access_token}"}
+
+@pytest.fixture
+def admin_auth_headers(client, admin_user, session_auth_headers):
+    """Create admin authentication headers for API requests."""
+    return session_auth_headers(admin_user.email)
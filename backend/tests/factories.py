@@ -0,0 +1,20 @@
+"""Test data factories."""
+
+import factory
+from app.models.recording import Recording
+from factory.alchemy import SQLAlchemyModelFactory
+
+
+class RecordingFactory(SQLAlchemyModelFactory):
+    """Build Recording rows; callers commit once for the whole batch."""
+
+    class Meta:
+        model = Recording
+        # Only add to the session so a batch is flushed as one executemany INSERT
+        sqlalchemy_session_persistence = None
+
+    filename = factory.Sequence(lambda n: f"test_audio_{n}.mp3")
+    original_filename = factory.SelfAttribute("filename")
+    file_path = factory.LazyAttribute(lambda o: f"recordings/{o.filename}")
+    duration = None
+    sample_rate = None
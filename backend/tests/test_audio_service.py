@@ -1,5 +1,6 @@
 """Tests for AudioService functionality."""
 
+import io
 import os
 import tempfile
 from pathlib import Path
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pytest
+import soundfile as sf
 from app.services.audio_service import (
     AudioMetadata,
     AudioProcessingError,
@@ -215,6 +217,30 @@ class TestExtractAudioMetadataFromBytes:
                 # Verify cleanup
                 mock_unlink.assert_called_once_with("/tmp/test_audio.mp3")
 
+    def test_extract_from_wav_bytes_reads_header(self, service):
+        """Test that WAV metadata comes from the header without a temp file."""
+        buffer = io.BytesIO()
+        sf.write(buffer, np.zeros(33075, dtype=np.float32), 22050, format="WAV")
+
+        with patch("tempfile.NamedTemporaryFile") as mock_temp:
+            result = service.extract_audio_metadata_from_bytes(buffer.getvalue(), ".wav")
+
+        mock_temp.assert_not_called()
+        assert result.duration == pytest.approx(1.5)
+        assert result.sample_rate == 22050
+        assert result.channels == 1
+
+    def test_extract_from_stereo_wav_bytes_reports_mono(self, service):
+        """Test that the header fast path reports one channel, matching the librosa path."""
+        buffer = io.BytesIO()
+        sf.write(buffer, np.zeros((44100, 2), dtype=np.float32), 44100, format="WAV")
+
+        result = service.extract_audio_metadata_from_bytes(buffer.getvalue(), ".wav")
+
+        assert result.duration == pytest.approx(1.0)
+        assert result.sample_rate == 44100
+        assert result.channels == 1
+
 
 class TestLoadAudioForProcessing:
     """Test load_audio_for_processing method."""
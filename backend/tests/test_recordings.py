@@ -2,61 +2,89 @@
 
 import io
 import json
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
-import numpy as np
 import pytest
 from app.models.project import Project
 from app.models.recording import Recording
-from app.services.audio_service import AudioMetadata
+from app.services.audio_service import AudioMetadata, AudioProcessingError
 from fastapi import status
 
+pytestmark = pytest.mark.fast
+
+# Shared payload for fake uploads/downloads; each test wraps it in a fresh BytesIO
+_FAKE_AUDIO_BYTES = b"fake mp3 content"
+_FAKE_AUDIO_CHUNK = memoryview(_FAKE_AUDIO_BYTES)
+
+
+def _fake_get_file(*args, **kwargs):
+    """Return a fresh single-chunk stream over the shared fake audio buffer."""
+    return iter((_FAKE_AUDIO_CHUNK,))
+
+
+class _FakeTempFile(SimpleNamespace):
+    """Minimal stand-in for a ``NamedTemporaryFile`` context manager."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def write(self, data):
+        return len(data)
+
 
 class TestRecordingUpload:
     """Test recording upload with duration extraction."""
 
+    @pytest.fixture
+    def upload_url(self, test_project):
+        """Upload endpoint URL for the test project, built once per test."""
+        return f"/api/v1/recordings/{test_project.id}/upload"
+
     def test_upload_with_successful_duration_extraction(
-        self, client, test_db, test_project, auth_headers, mock_minio_client
+        self, client, test_db, test_project, upload_url, auth_headers, mock_minio_client
     ):
         """Test successful recording upload with duration extraction."""
         project_id = test_project.id
 
         # Create fake audio file
-        audio_content = b"fake mp3 content for testing duration extraction"
-        audio_file = io.BytesIO(audio_content)
+        audio_file = io.BytesIO(_FAKE_AUDIO_BYTES)
 
-        # Mock librosa operations for duration extraction
-        with patch("app.api.api_v1.endpoints.recordings.librosa") as mock_librosa:
-            mock_audio_data = np.random.random(88200)  # 2 seconds at 44100 Hz
+        # Mock metadata extraction for the uploaded bytes
+        with patch("app.api.api_v1.endpoints.recordings.audio_service") as mock_audio_service:
             mock_sample_rate = 44100
             mock_duration = 2.0
 
-            mock_librosa.load.return_value = (mock_audio_data, mock_sample_rate)
-            mock_librosa.get_duration.return_value = mock_duration
+            mock_audio_service.extract_audio_metadata_from_bytes.return_value = AudioMetadata(
+                duration=mock_duration, sample_rate=mock_sample_rate
+            )
 
             # Mock MinIO upload
             with patch("app.api.api_v1.endpoints.recordings.minio_client") as mock_minio:
-                mock_minio.put_file.return_value = True
+                mock_minio.upload_file.return_value = True
 
                 # Mock secure temp file
                 with patch("app.api.api_v1.endpoints.recordings.secure_temp_file") as mock_temp:
                     mock_temp.return_value.__enter__.return_value = "/tmp/test_audio.mp3"
 
-                    # Mock file writing
-                    with patch("builtins.open", create=True) as mock_open:
-                        mock_file = MagicMock()
-                        mock_open.return_value.__enter__.return_value = mock_file
-
-                        # Upload file
-                        response = client.post(
-                            f"/api/v1/recordings/{project_id}/upload",
-                            files={"file": ("test_audio.mp3", audio_file, "audio/mpeg")},
-                            headers=auth_headers,
-                        )
+                    # Upload file
+                    response = client.post(
+                        upload_url,
+                        files={"file": ("test_audio.mp3", audio_file, "audio/mpeg")},
+                        headers=auth_headers,
+                    )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
 
+        # The upload body is analyzed in memory, keyed by its extension
+        mock_audio_service.extract_audio_metadata_from_bytes.assert_called_once_with(
+            _FAKE_AUDIO_BYTES, ".mp3"
+        )
+
         # Verify recording was created with duration
         assert "id" in data
         assert data["filename"].endswith("test_audio.mp3")
@@ -72,34 +100,29 @@ class TestRecordingUpload:
         assert recording.sample_rate == mock_sample_rate
 
     def test_upload_with_duration_extraction_failure(
-        self, client, test_db, test_project, auth_headers
+        self, client, test_db, upload_url, auth_headers
     ):
         """Test recording upload when duration extraction fails."""
-        project_id = test_project.id
-
         # Create fake audio file
-        audio_content = b"fake corrupted mp3 content"
-        audio_file = io.BytesIO(audio_content)
+        audio_file = io.BytesIO(_FAKE_AUDIO_BYTES)
 
-        # Mock librosa failure
-        with patch("app.api.api_v1.endpoints.recordings.librosa") as mock_librosa:
-            mock_librosa.load.side_effect = Exception("Failed to load corrupted audio")
+        # Mock metadata extraction failure
+        with patch("app.api.api_v1.endpoints.recordings.audio_service") as mock_audio_service:
+            mock_audio_service.extract_audio_metadata_from_bytes.side_effect = AudioProcessingError(
+                "Failed to load corrupted audio"
+            )
 
             with patch("app.api.api_v1.endpoints.recordings.minio_client") as mock_minio:
-                mock_minio.put_file.return_value = True
+                mock_minio.upload_file.return_value = True
 
                 with patch("app.api.api_v1.endpoints.recordings.secure_temp_file") as mock_temp:
                     mock_temp.return_value.__enter__.return_value = "/tmp/test_audio.mp3"
 
-                    with patch("builtins.open", create=True) as mock_open:
-                        mock_file = MagicMock()
-                        mock_open.return_value.__enter__.return_value = mock_file
-
-                        response = client.post(
-                            f"/api/v1/recordings/{project_id}/upload",
-                            files={"file": ("corrupted.mp3", audio_file, "audio/mpeg")},
-                            headers=auth_headers,
-                        )
+                    response = client.post(
+                        upload_url,
+                        files={"file": ("corrupted.mp3", audio_file, "audio/mpeg")},
+                        headers=auth_headers,
+                    )
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -115,16 +138,14 @@ class TestRecordingUpload:
         assert recording.duration is None
         assert recording.sample_rate is None
 
-    def test_upload_with_unsupported_file_type(self, client, test_project, auth_headers):
+    def test_upload_with_unsupported_file_type(self, client, upload_url, auth_headers):
         """Test upload with unsupported file type."""
-        project_id = test_project.id
-
         # Create fake text file
         text_content = b"This is not an audio file"
         text_file = io.BytesIO(text_content)
 
         response = client.post(
-            f"/api/v1/recordings/{project_id}/upload",
+            upload_url,
             files={"file": ("test.txt", text_file, "text/plain")},
             headers=auth_headers,
         )
@@ -132,16 +153,14 @@ class TestRecordingUpload:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "not supported" in response.json()["detail"].lower()
 
-    def test_upload_with_large_file(self, client, test_project, auth_headers):
+    def test_upload_with_large_file(self, client, upload_url, auth_headers):
         """Test upload with file size limit exceeded."""
-        project_id = test_project.id
-
         # Create oversized content (simulate large file)
         large_content = b"x" * (100 * 1024 * 1024 + 1)  # Over 100MB
         large_file = io.BytesIO(large_content)
 
         response = client.post(
-            f"/api/v1/recordings/{project_id}/upload",
+            upload_url,
             files={"file": ("large_audio.mp3", large_file, "audio/mpeg")},
             headers=auth_headers,
         )
@@ -149,35 +168,34 @@ class TestRecordingUpload:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "too large" in response.json()["detail"].lower()
 
-    def test_upload_triggers_spectrogram_task(self, client, test_db, test_project, auth_headers):
+    def test_upload_triggers_spectrogram_task(self, client, test_db, upload_url, auth_headers):
         """Test that upload triggers spectrogram generation task."""
-        project_id = test_project.id
-
-        audio_content = b"fake mp3 content"
-        audio_file = io.BytesIO(audio_content)
+        audio_file = io.BytesIO(_FAKE_AUDIO_BYTES)
 
-        # Mock librosa and other dependencies
-        with patch("app.api.api_v1.endpoints.recordings.librosa") as mock_librosa, patch(
+        # Mock metadata extraction and other dependencies
+        with patch(
+            "app.api.api_v1.endpoints.recordings.audio_service"
+        ) as mock_audio_service, patch(
             "app.api.api_v1.endpoints.recordings.minio_client"
         ) as mock_minio, patch(
             "app.api.api_v1.endpoints.recordings.secure_temp_file"
-        ) as mock_temp, patch(
-            "builtins.open", create=True
-        ):
+        ) as mock_temp:
 
-            mock_librosa.load.return_value = (np.random.random(44100), 44100)
-            mock_librosa.get_duration.return_value = 1.0
-            mock_minio.put_file.return_value = True
+            mock_audio_service.extract_audio_metadata_from_bytes.return_value = AudioMetadata(
+                duration=1.0, sample_rate=44100
+            )
+            mock_minio.upload_file.return_value = True
             mock_temp.return_value.__enter__.return_value = "/tmp/test.mp3"
 
             # Mock Celery task
             with patch(
-                "app.api.api_v1.endpoints.recordings.generate_spectrogram_task"
+                "app.api.api_v1.endpoints.recordings.generate_spectrogram_task",
+                new=Mock(spec=["delay"]),
             ) as mock_task:
                 mock_task.delay.return_value.id = "test-task-id"
 
                 response = client.post(
-                    f"/api/v1/recordings/{project_id}/upload",
+                    upload_url,
                     files={"file": ("test.mp3", audio_file, "audio/mpeg")},
                     headers=auth_headers,
                 )
@@ -194,51 +212,34 @@ class TestBackfillDurations:
     """Test backfill missing durations endpoint."""
 
     def test_backfill_missing_durations_success(
-        self, client, test_db, test_project, admin_auth_headers
+        self, client, test_db, recording_factory, admin_auth_headers
     ):
         """Test successful backfill of missing durations."""
         # Create recordings with missing durations
-        recordings_without_duration = []
-        for i in range(3):
-            recording = Recording(
-                filename=f"test_audio_{i}.mp3",
-                original_filename=f"test_audio_{i}.mp3",
-                file_path=f"recordings/test_audio_{i}.mp3",
-                duration=None,
-                sample_rate=None,
-                project_id=test_project.id,
-            )
-            test_db.add(recording)
-            recordings_without_duration.append(recording)
+        recordings_without_duration = recording_factory(3)
 
-        test_db.commit()
-
-        # Mock MinIO and librosa operations
+        # Mock MinIO and audio analysis
         with patch("app.api.api_v1.endpoints.recordings.minio_client") as mock_minio, patch(
-            "app.api.api_v1.endpoints.recordings.librosa"
-        ) as mock_librosa:
+            "app.api.api_v1.endpoints.recordings.audio_service"
+        ) as mock_audio_service:
 
             # Mock MinIO file download
-            fake_audio_content = b"fake mp3 content"
-            mock_minio.get_file.return_value = iter([fake_audio_content])
+            mock_minio.get_file.side_effect = _fake_get_file
 
-            # Mock librosa analysis
-            mock_audio_data = np.random.random(66150)  # 1.5 seconds at 44100 Hz
+            # Mock metadata extraction from the downloaded temp file
             mock_sample_rate = 44100
             mock_duration = 1.5
 
-            mock_librosa.load.return_value = (mock_audio_data, mock_sample_rate)
-            mock_librosa.get_duration.return_value = mock_duration
+            mock_audio_service.extract_audio_metadata.return_value = AudioMetadata(
+                duration=mock_duration, sample_rate=mock_sample_rate
+            )
 
             # Mock tempfile operations
             with patch("tempfile.NamedTemporaryFile") as mock_temp, patch(
                 "os.unlink"
             ) as mock_unlink:
 
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/backfill_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+                mock_temp.return_value = _FakeTempFile(name="/tmp/backfill_audio.mp3")
 
                 response = client.post(
                     "/api/v1/recordings/backfill-durations", headers=admin_auth_headers
@@ -247,15 +248,21 @@ class TestBackfillDurations:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
 
+        # Every recording's spilled download was analyzed
+        assert mock_audio_service.extract_audio_metadata.call_count == 3
+        mock_audio_service.extract_audio_metadata.assert_called_with("/tmp/backfill_audio.mp3")
+
         # Verify response structure
         assert data["updated_count"] == 3
         assert data["failed_count"] == 0
         assert data["total_processed"] == 3
         assert "No recordings found" not in data["message"]
 
-        # Verify recordings were updated in database
-        for recording in recordings_without_duration:
-            test_db.refresh(recording)
+        # Verify recordings were updated in database (single SELECT for all rows)
+        ids = [r.id for r in recordings_without_duration]
+        refreshed = test_db.query(Recording).filter(Recording.id.in_(ids)).all()
+        assert len(refreshed) == len(ids)
+        for recording in refreshed:
             assert recording.duration == mock_duration
             assert recording.sample_rate == mock_sample_rate
 
@@ -277,52 +284,35 @@ class TestBackfillDurations:
         assert data["total_processed"] == 0
         assert "No recordings found with missing duration" in data["message"]
 
-    def test_backfill_with_some_failures(self, client, test_db, test_project, admin_auth_headers):
+    def test_backfill_with_some_failures(
+        self, client, test_db, recording_factory, admin_auth_headers
+    ):
         """Test backfill with some recordings failing to process."""
         # Create recordings with missing durations
-        success_recording = Recording(
-            filename="success.mp3",
-            original_filename="success.mp3",
-            file_path="recordings/success.mp3",
-            duration=None,
-            project_id=test_project.id,
-        )
-
-        fail_recording = Recording(
-            filename="fail.mp3",
-            original_filename="fail.mp3",
-            file_path="recordings/fail.mp3",
-            duration=None,
-            project_id=test_project.id,
-        )
-
-        test_db.add(success_recording)
-        test_db.add(fail_recording)
-        test_db.commit()
+        recording_factory(1, filename="success.mp3")
+        recording_factory(1, filename="fail.mp3")
 
         with patch("app.api.api_v1.endpoints.recordings.minio_client") as mock_minio, patch(
-            "app.api.api_v1.endpoints.recordings.librosa"
-        ) as mock_librosa:
+            "app.api.api_v1.endpoints.recordings.audio_service"
+        ) as mock_audio_service:
 
             # Mock MinIO to succeed for first file, fail for second
             def mock_get_file(bucket_name, object_name):
                 if "success" in object_name:
-                    return iter([b"fake audio content"])
+                    return _fake_get_file(bucket_name, object_name)
                 else:
                     raise Exception("Failed to download file")
 
             mock_minio.get_file.side_effect = mock_get_file
 
-            # Mock librosa for successful case
-            mock_librosa.load.return_value = (np.random.random(44100), 44100)
-            mock_librosa.get_duration.return_value = 1.0
+            # Mock metadata extraction for successful case
+            mock_audio_service.extract_audio_metadata.return_value = AudioMetadata(
+                duration=1.0, sample_rate=44100
+            )
 
             with patch("tempfile.NamedTemporaryFile") as mock_temp, patch("os.unlink"):
 
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+                mock_temp.return_value = _FakeTempFile(name="/tmp/test.mp3")
 
                 response = client.post(
                     "/api/v1/recordings/backfill-durations", headers=admin_auth_headers
@@ -331,6 +321,8 @@ class TestBackfillDurations:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
 
+        # Only the downloaded file reaches the analyzer
+        mock_audio_service.extract_audio_metadata.assert_called_once_with("/tmp/test.mp3")
         assert data["updated_count"] == 1  # Only success_recording
         assert data["failed_count"] == 1  # fail_recording failed
         assert data["total_processed"] == 2
@@ -350,39 +342,30 @@ class TestBackfillDurations:
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_backfill_with_librosa_failures(
-        self, client, test_db, test_project, admin_auth_headers
+    def test_backfill_with_analysis_failures(
+        self, client, test_db, recording_factory, admin_auth_headers
     ):
-        """Test backfill when librosa fails to process files."""
+        """Test backfill when audio analysis fails to process files."""
         # Create recording with missing duration
-        recording = Recording(
-            filename="corrupted.mp3",
-            original_filename="corrupted.mp3",
-            file_path="recordings/corrupted.mp3",
-            duration=None,
-            project_id=test_project.id,
-        )
-        test_db.add(recording)
-        test_db.commit()
+        recording_factory(1, filename="corrupted.mp3")
 
         with patch("app.api.api_v1.endpoints.recordings.minio_client") as mock_minio, patch(
-            "app.api.api_v1.endpoints.recordings.librosa"
-        ) as mock_librosa:
+            "app.api.api_v1.endpoints.recordings.audio_service"
+        ) as mock_audio_service:
 
             # Mock successful MinIO download
-            mock_minio.get_file.return_value = iter([b"corrupted audio content"])
+            mock_minio.get_file.side_effect = _fake_get_file
 
-            # Mock librosa failure
-            mock_librosa.load.side_effect = Exception("Corrupted audio file")
+            # Mock analysis failure
+            mock_audio_service.extract_audio_metadata.side_effect = AudioProcessingError(
+                "Corrupted audio file"
+            )
 
             with patch("tempfile.NamedTemporaryFile") as mock_temp, patch(
                 "os.unlink"
             ) as mock_unlink:
 
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/corrupted.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+                mock_temp.return_value = _FakeTempFile(name="/tmp/corrupted.mp3")
 
                 response = client.post(
                     "/api/v1/recordings/backfill-durations", headers=admin_auth_headers
@@ -397,20 +380,10 @@ class TestBackfillDurations:
         assert "errors" in data
         assert "Corrupted audio file" in data["errors"][0]
 
-    def test_backfill_error_limit(self, client, test_db, test_project, admin_auth_headers):
+    def test_backfill_error_limit(self, client, test_db, recording_factory, admin_auth_headers):
         """Test that backfill limits the number of errors returned."""
-        # Create many recordings that will fail
-        for i in range(15):  # More than the 10 error limit
-            recording = Recording(
-                filename=f"fail_{i}.mp3",
-                original_filename=f"fail_{i}.mp3",
-                file_path=f"recordings/fail_{i}.mp3",
-                duration=None,
-                project_id=test_project.id,
-            )
-            test_db.add(recording)
-
-        test_db.commit()
+        # Create many recordings that will fail (more than the 10 error limit)
+        recording_factory(15)
 
         with patch("app.api.api_v1.endpoints.recordings.minio_client") as mock_minio:
             # Mock all files to fail download
@@ -433,28 +406,13 @@ class TestBackfillDurations:
 class TestRecordingDurationFiltering:
     """Test duration-based filtering in recording list endpoint."""
 
-    def test_duration_filter_min(self, client, test_db, test_project, auth_headers):
+    def test_duration_filter_min(
+        self, client, test_db, test_project, recording_factory, auth_headers
+    ):
         """Test filtering recordings by minimum duration."""
         # Create recordings with different durations
-        short_recording = Recording(
-            filename="short.mp3",
-            original_filename="short.mp3",
-            file_path="recordings/short.mp3",
-            duration=2.5,
-            project_id=test_project.id,
-        )
-
-        long_recording = Recording(
-            filename="long.mp3",
-            original_filename="long.mp3",
-            file_path="recordings/long.mp3",
-            duration=10.0,
-            project_id=test_project.id,
-        )
-
-        test_db.add(short_recording)
-        test_db.add(long_recording)
-        test_db.commit()
+        recording_factory(1, filename="short.mp3", duration=2.5)
+        (long_recording,) = recording_factory(1, filename="long.mp3", duration=10.0)
 
         # Filter for recordings longer than 5 seconds
         response = client.get(
@@ -528,20 +486,21 @@ class TestRecordingIntegration:
         project_id = test_project.id
 
         # Step 1: Upload file with duration extraction failure
-        audio_content = b"fake corrupted mp3"
-        audio_file = io.BytesIO(audio_content)
+        audio_file = io.BytesIO(_FAKE_AUDIO_BYTES)
 
-        with patch("app.api.api_v1.endpoints.recordings.librosa") as mock_librosa, patch(
+        with patch(
+            "app.api.api_v1.endpoints.recordings.audio_service"
+        ) as mock_audio_service, patch(
             "app.api.api_v1.endpoints.recordings.minio_client"
         ) as mock_minio, patch(
             "app.api.api_v1.endpoints.recordings.secure_temp_file"
-        ) as mock_temp, patch(
-            "builtins.open", create=True
-        ):
+        ) as mock_temp:
 
             # Mock failed duration extraction during upload
-            mock_librosa.load.side_effect = Exception("Failed during upload")
-            mock_minio.put_file.return_value = True
+            mock_audio_service.extract_audio_metadata_from_bytes.side_effect = AudioProcessingError(
+                "Failed during upload"
+            )
+            mock_minio.upload_file.return_value = True
             mock_temp.return_value.__enter__.return_value = "/tmp/test.mp3"
 
             upload_response = client.post(
@@ -558,18 +517,18 @@ class TestRecordingIntegration:
 
         # Step 2: Run backfill to fix the duration
         with patch("app.api.api_v1.endpoints.recordings.minio_client") as mock_minio, patch(
-            "app.api.api_v1.endpoints.recordings.librosa"
-        ) as mock_librosa, patch("tempfile.NamedTemporaryFile") as mock_temp, patch("os.unlink"):
+            "app.api.api_v1.endpoints.recordings.audio_service"
+        ) as mock_audio_service, patch("tempfile.NamedTemporaryFile") as mock_temp, patch(
+            "os.unlink"
+        ):
 
             # Mock successful duration extraction during backfill
-            mock_minio.get_file.return_value = iter([b"fake audio content"])
-            mock_librosa.load.return_value = (np.random.random(88200), 44100)
-            mock_librosa.get_duration.return_value = 2.0
-
-            mock_file = MagicMock()
-            mock_file.name = "/tmp/backfill.mp3"
-            mock_file.__enter__.return_value = mock_file
-            mock_temp.return_value = mock_file
+            mock_minio.get_file.side_effect = _fake_get_file
+            mock_audio_service.extract_audio_metadata.return_value = AudioMetadata(
+                duration=2.0, sample_rate=44100
+            )
+
+            mock_temp.return_value = _FakeTempFile(name="/tmp/backfill.mp3")
 
             backfill_response = client.post(
                 "/api/v1/recordings/backfill-durations", headers=admin_auth_headers
@@ -1,14 +1,34 @@
 """Tests for spectrogram task duration update functionality."""
 
+import io
 import os
-import tempfile
 from unittest.mock import MagicMock, Mock, patch
 
 import numpy as np
 import pytest
 from app.models.recording import Recording
 from app.models.spectrogram import Spectrogram, SpectrogramStatus
-from app.tasks.spectrogram_tasks import generate_spectrogram_task
+from app.tasks.spectrogram_kernels import normalize_db_to_uint8
+from app.tasks.spectrogram_tasks import (
+    _viridis_lut,
+    compute_stft_magnitude,
+    generate_spectrogram_task,
+    load_audio,
+)
+
+
+@pytest.fixture(scope="session")
+def canonical_audio():
+    """Read-only mock waveforms shared across tests, keyed by sample count.
+
+    The task tests only look at the length of the decoded audio, so silence is enough.
+    """
+    waveforms = {}
+    for num_samples in (22050, 44100, 48000, 55125, 88200, 154350):
+        y = np.zeros(num_samples, dtype=np.float32)
+        y.flags.writeable = False
+        waveforms[num_samples] = y
+    return waveforms
 
 
 @pytest.fixture
@@ -24,8 +44,7 @@ def mock_minio_operations():
     with patch("app.tasks.spectrogram_tasks.minio_client") as mock_client:
         # Mock audio file download
         fake_audio_data = b"fake mp3 audio content for testing"
-        mock_client.get_file.return_value = MagicMock()
-        mock_client.get_file.return_value.read.return_value = fake_audio_data
+        mock_client.get_file.return_value = io.BytesIO(fake_audio_data)
 
         # Mock image upload
         mock_client.put_file.return_value = True
@@ -42,6 +61,116 @@ def mock_spectrogram_generation():
         yield mock_gen
 
 
+class TestLoadAudio:
+    """Test audio decoding used by the spectrogram task."""
+
+    def test_stereo_is_downmixed_to_mono(self):
+        """Test that multi-channel soundfile output is averaged to mono."""
+        stereo = np.array([[0.0, 1.0], [0.5, 0.5]], dtype=np.float32)
+
+        with patch("app.tasks.spectrogram_tasks.sf.read", return_value=(stereo, 22050)):
+            y, sr = load_audio("/tmp/test_audio.wav")
+
+        assert sr == 22050
+        np.testing.assert_allclose(y, [0.5, 0.5])
+
+    def test_falls_back_to_librosa_when_soundfile_fails(self):
+        """Test that formats libsndfile cannot decode are loaded with librosa."""
+        with patch(
+            "app.tasks.spectrogram_tasks.sf.read", side_effect=RuntimeError("unsupported")
+        ), patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
+            mock_librosa.load.return_value = (np.zeros(10, dtype=np.float32), 44100)
+
+            y, sr = load_audio("/tmp/test_audio.mp3")
+
+        mock_librosa.load.assert_called_once_with("/tmp/test_audio.mp3", sr=None)
+        assert sr == 44100
+        assert len(y) == 10
+
+    def test_buffer_fallback_spills_to_temp_file(self):
+        """Test that an undecodable buffer is written to disk for librosa."""
+        buffer = io.BytesIO(b"fake m4a content")
+        buffer.read()
+        seen = {}
+
+        def fake_load(path, sr=None):
+            with open(path, "rb") as f:
+                seen["content"] = f.read()
+            seen["suffix"] = os.path.splitext(path)[1]
+            return np.zeros(10, dtype=np.float32), 44100
+
+        with patch(
+            "app.tasks.spectrogram_tasks.sf.read", side_effect=RuntimeError("unsupported")
+        ), patch("app.tasks.spectrogram_tasks.librosa.load", side_effect=fake_load):
+            y, sr = load_audio(buffer, suffix=".m4a")
+
+        assert seen == {"content": b"fake m4a content", "suffix": ".m4a"}
+        assert sr == 44100
+
+
+class TestComputeStftMagnitude:
+    """Test the batched STFT used for spectrogram images."""
+
+    def test_matches_librosa_stft(self):
+        """Test that the magnitude matches librosa's centered STFT."""
+        import librosa
+
+        y = np.random.default_rng(0).standard_normal(4096).astype(np.float32)
+
+        result = compute_stft_magnitude(y, n_fft=512, hop_length=128)
+        expected = np.abs(librosa.stft(y, n_fft=512, hop_length=128))
+
+        assert result.shape == expected.shape
+        np.testing.assert_allclose(result, expected, rtol=1e-3, atol=1e-3)
+
+    def test_gpu_failure_falls_back_to_cpu(self):
+        """Test that a failing GPU STFT falls back to the CPU implementation."""
+        y = np.random.default_rng(0).standard_normal(2048).astype(np.float32)
+        expected = compute_stft_magnitude(y, n_fft=256, hop_length=64)
+
+        with patch("app.tasks.spectrogram_tasks._gpu_stft_available", return_value=True), patch(
+            "app.tasks.spectrogram_tasks._compute_stft_magnitude_gpu",
+            side_effect=RuntimeError("CUDA out of memory"),
+        ) as mock_gpu:
+            result = compute_stft_magnitude(y, n_fft=256, hop_length=64)
+
+        mock_gpu.assert_called_once()
+        np.testing.assert_array_equal(result, expected)
+
+
+class TestNormalizeDbToUint8:
+    """Test the numba normalization kernel."""
+
+    def test_matches_numpy_normalization(self):
+        """Test that the kernel matches the scale-then-flip NumPy expression."""
+        S_db = np.random.default_rng(0).uniform(-80, 0, size=(64, 48)).astype(np.float32)
+
+        shifted = S_db - S_db.min()
+        expected = np.flipud((shifted / shifted.max() * 255).astype(np.uint8))
+
+        np.testing.assert_array_equal(normalize_db_to_uint8(S_db), expected)
+
+    def test_constant_input_is_zero(self):
+        """Test that a flat spectrogram maps to zeros instead of dividing by zero."""
+        result = normalize_db_to_uint8(np.full((4, 4), -80.0))
+
+        assert result.dtype == np.uint8
+        assert not result.any()
+
+
+class TestViridisLut:
+    """Test the precomputed colormap lookup table."""
+
+    def test_matches_colormap_call(self):
+        """Test that the LUT gather reproduces matplotlib's colormap output."""
+        from matplotlib import cm
+
+        S_db_norm = np.random.default_rng(0).integers(0, 256, size=(64, 48), dtype=np.uint8)
+        expected = (cm.get_cmap("viridis")(S_db_norm)[:, :, :3] * 255).astype(np.uint8)
+
+        np.testing.assert_array_equal(_viridis_lut()[S_db_norm], expected)
+
+
 class TestSpectrogramTaskDurationUpdate:
     """Test duration updating functionality in spectrogram generation task."""
 
@@ -52,6 +181,7 @@ class TestSpectrogramTaskDurationUpdate:
         mock_celery_task,
         mock_minio_operations,
         mock_spectrogram_generation,
+        canonical_audio,
     ):
         """Test that missing duration is updated during spectrogram generation."""
         recording_id = test_recording_no_duration.id
@@ -60,40 +190,33 @@ class TestSpectrogramTaskDurationUpdate:
         assert test_recording_no_duration.duration is None
         assert test_recording_no_duration.sample_rate is None
 
-        # Mock librosa operations
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
+        # Mock audio decoding
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf:
             # Mock 2.5 seconds of audio at 22050 Hz
-            mock_audio_data = np.random.random(55125)  # 2.5 * 22050 = 55125
+            mock_audio_data = canonical_audio[55125]  # 2.5 * 22050 = 55125
             mock_sample_rate = 22050
-            mock_librosa.load.return_value = (mock_audio_data, mock_sample_rate)
-
-            # Mock tempfile operations
-            with patch("tempfile.NamedTemporaryFile") as mock_temp:
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
-
-                # Execute the task
-                with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
-                    mock_get_db.return_value.__enter__.return_value = test_db
-
-                    # Mock Spectrogram creation and update
-                    with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
-                        mock_spec = MagicMock()
-                        MockSpectrogram.return_value = mock_spec
-
-                        try:
-                            generate_spectrogram_task(recording_id)
-                        except Exception:
-                            # Task might fail due to missing dependencies, but we're testing the duration update
-                            pass
+            mock_sf.read.return_value = (mock_audio_data, mock_sample_rate)
+
+            # Execute the task
+            with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
+                mock_get_db.return_value.__enter__.return_value = test_db
+
+                # Mock Spectrogram creation and update
+                with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
+                    mock_spec = MagicMock()
+                    MockSpectrogram.return_value = mock_spec
+
+                    try:
+                        generate_spectrogram_task(recording_id)
+                    except Exception:
+                        # Task might fail due to missing dependencies, but we're testing the duration update
+                        pass
 
             # Verify duration was calculated correctly
             expected_duration = len(mock_audio_data) / mock_sample_rate  # 2.5 seconds
 
-            # Check that librosa.load was called
-            mock_librosa.load.assert_called()
+            # Check that soundfile.read was called
+            mock_sf.read.assert_called()
 
             # Refresh recording from database
             test_db.refresh(test_recording_no_duration)
@@ -105,6 +228,7 @@ class TestSpectrogramTaskDurationUpdate:
         mock_celery_task,
         mock_minio_operations,
         mock_spectrogram_generation,
+        canonical_audio,
     ):
         """Test that existing duration is not overwritten during spectrogram generation."""
         recording_id = test_recording.id
@@ -115,33 +239,26 @@ class TestSpectrogramTaskDurationUpdate:
         assert original_duration is not None
         assert original_sample_rate is not None
 
-        # Mock librosa operations with different values
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
+        # Mock audio decoding with different values
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf:
             # Mock different duration to ensure it doesn't overwrite
-            mock_audio_data = np.random.random(88200)  # 4 seconds at 22050 Hz
+            mock_audio_data = canonical_audio[88200]  # 4 seconds at 22050 Hz
             mock_sample_rate = 22050
-            mock_librosa.load.return_value = (mock_audio_data, mock_sample_rate)
-
-            # Mock tempfile operations
-            with patch("tempfile.NamedTemporaryFile") as mock_temp:
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+            mock_sf.read.return_value = (mock_audio_data, mock_sample_rate)
 
-                # Execute the task
-                with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
-                    mock_get_db.return_value.__enter__.return_value = test_db
+            # Execute the task
+            with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
+                mock_get_db.return_value.__enter__.return_value = test_db
 
-                    # Mock Spectrogram creation
-                    with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
-                        mock_spec = MagicMock()
-                        MockSpectrogram.return_value = mock_spec
+                # Mock Spectrogram creation
+                with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
+                    mock_spec = MagicMock()
+                    MockSpectrogram.return_value = mock_spec
 
-                        try:
-                            generate_spectrogram_task(recording_id)
-                        except Exception:
-                            pass
+                    try:
+                        generate_spectrogram_task(recording_id)
+                    except Exception:
+                        pass
 
             # Refresh recording and verify duration wasn't changed
             test_db.refresh(test_recording)
@@ -154,6 +271,7 @@ class TestSpectrogramTaskDurationUpdate:
         mock_celery_task,
         mock_minio_operations,
         mock_spectrogram_generation,
+        canonical_audio,
     ):
         """Test that sample rate is updated when it differs from stored value."""
         recording_id = test_recording_no_duration.id
@@ -162,29 +280,23 @@ class TestSpectrogramTaskDurationUpdate:
         test_recording_no_duration.sample_rate = 44100
         test_db.commit()
 
-        # Mock librosa with different sample rate
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
-            mock_audio_data = np.random.random(22050)  # 1 second
+        # Mock audio decoding with different sample rate
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf:
+            mock_audio_data = canonical_audio[22050]  # 1 second
             new_sample_rate = 22050  # Different from stored 44100
-            mock_librosa.load.return_value = (mock_audio_data, new_sample_rate)
-
-            with patch("tempfile.NamedTemporaryFile") as mock_temp:
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+            mock_sf.read.return_value = (mock_audio_data, new_sample_rate)
 
-                with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
-                    mock_get_db.return_value.__enter__.return_value = test_db
+            with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
+                mock_get_db.return_value.__enter__.return_value = test_db
 
-                    with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
-                        mock_spec = MagicMock()
-                        MockSpectrogram.return_value = mock_spec
+                with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
+                    mock_spec = MagicMock()
+                    MockSpectrogram.return_value = mock_spec
 
-                        try:
-                            generate_spectrogram_task(recording_id)
-                        except Exception:
-                            pass
+                    try:
+                        generate_spectrogram_task(recording_id)
+                    except Exception:
+                        pass
 
             # Verify sample rate was updated
             test_db.refresh(test_recording_no_duration)
@@ -198,29 +310,23 @@ class TestSpectrogramTaskDurationUpdate:
         recording_id = test_recording.id
 
         # Mock MinIO to return audio data
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
-            # Simulate librosa loading failure
-            mock_librosa.load.side_effect = Exception("Failed to load audio file")
-
-            with patch("tempfile.NamedTemporaryFile") as mock_temp:
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf:
+            # Simulate audio decoding failure
+            mock_sf.read.side_effect = Exception("Failed to load audio file")
 
-                with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
-                    mock_get_db.return_value.__enter__.return_value = test_db
+            with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
+                mock_get_db.return_value.__enter__.return_value = test_db
 
-                    with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
-                        mock_spec = MagicMock()
-                        MockSpectrogram.return_value = mock_spec
+                with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
+                    mock_spec = MagicMock()
+                    MockSpectrogram.return_value = mock_spec
 
-                        # Task should handle the failure gracefully
-                        with pytest.raises(Exception):
-                            generate_spectrogram_task(recording_id)
+                    # Task should handle the failure gracefully
+                    with pytest.raises(Exception):
+                        generate_spectrogram_task(recording_id)
 
-                        # Verify that the spectrogram status is set to failed
-                        # (This would need to be verified based on actual implementation)
+                    # Verify that the spectrogram status is set to failed
+                    # (This would need to be verified based on actual implementation)
 
     def test_duration_calculation_consistency(
         self,
@@ -229,37 +335,32 @@ class TestSpectrogramTaskDurationUpdate:
         mock_celery_task,
         mock_minio_operations,
         mock_spectrogram_generation,
+        canonical_audio,
     ):
         """Test that duration calculation is consistent with AudioService approach."""
         recording_id = test_recording_no_duration.id
 
-        # Mock librosa operations
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
+        # Mock audio decoding
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf:
             # Create specific audio data for consistent calculation
             sample_rate = 44100
             duration_seconds = 3.5
             num_samples = int(duration_seconds * sample_rate)  # 154350 samples
-            mock_audio_data = np.random.random(num_samples)
-
-            mock_librosa.load.return_value = (mock_audio_data, sample_rate)
+            mock_audio_data = canonical_audio[num_samples]
 
-            with patch("tempfile.NamedTemporaryFile") as mock_temp:
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+            mock_sf.read.return_value = (mock_audio_data, sample_rate)
 
-                with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
-                    mock_get_db.return_value.__enter__.return_value = test_db
+            with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
+                mock_get_db.return_value.__enter__.return_value = test_db
 
-                    with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
-                        mock_spec = MagicMock()
-                        MockSpectrogram.return_value = mock_spec
+                with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
+                    mock_spec = MagicMock()
+                    MockSpectrogram.return_value = mock_spec
 
-                        try:
-                            generate_spectrogram_task(recording_id)
-                        except Exception:
-                            pass
+                    try:
+                        generate_spectrogram_task(recording_id)
+                    except Exception:
+                        pass
 
             # Calculate expected duration using the same method as the task
             expected_duration = len(mock_audio_data) / sample_rate
@@ -276,26 +377,20 @@ class TestSpectrogramTaskIntegration:
         mock_celery_task,
         mock_minio_operations,
         mock_spectrogram_generation,
+        canonical_audio,
     ):
         """Test complete spectrogram generation workflow including duration update."""
         recording_id = test_recording_no_duration.id
 
         # Mock all required operations
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa, patch(
-            "tempfile.NamedTemporaryFile"
-        ) as mock_temp, patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db, patch(
-            "app.tasks.spectrogram_tasks.logger"
-        ) as mock_logger:
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf, patch(
+            "app.tasks.spectrogram_tasks.get_db_session"
+        ) as mock_get_db, patch("app.tasks.spectrogram_tasks.logger") as mock_logger:
 
             # Setup mocks
-            mock_audio_data = np.random.random(88200)  # 2 seconds at 44100 Hz
+            mock_audio_data = canonical_audio[88200]  # 2 seconds at 44100 Hz
             mock_sample_rate = 44100
-            mock_librosa.load.return_value = (mock_audio_data, mock_sample_rate)
-
-            mock_file = MagicMock()
-            mock_file.name = "/tmp/test_spectrogram.mp3"
-            mock_file.__enter__.return_value = mock_file
-            mock_temp.return_value = mock_file
+            mock_sf.read.return_value = (mock_audio_data, mock_sample_rate)
 
             mock_get_db.return_value.__enter__.return_value = test_db
 
@@ -312,8 +407,8 @@ class TestSpectrogramTaskIntegration:
                     # but we can still verify the mocks were called correctly
                     pass
 
-            # Verify that librosa.load was called
-            mock_librosa.load.assert_called()
+            # Verify that soundfile.read was called
+            mock_sf.read.assert_called()
 
             # Verify that duration calculation would have been performed
             expected_duration = len(mock_audio_data) / mock_sample_rate
@@ -326,25 +421,18 @@ class TestSpectrogramTaskIntegration:
         mock_celery_task,
         mock_minio_operations,
         mock_spectrogram_generation,
+        canonical_audio,
     ):
         """Test that Nyquist frequency is calculated correctly with updated sample rate."""
         recording_id = test_recording_no_duration.id
 
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf:
             # Mock specific sample rate
             sample_rate = 48000  # Higher quality audio
-            mock_audio_data = np.random.random(48000)  # 1 second
-            mock_librosa.load.return_value = (mock_audio_data, sample_rate)
-
-            with patch("tempfile.NamedTemporaryFile") as mock_temp, patch(
-                "app.tasks.spectrogram_tasks.get_db_session"
-            ) as mock_get_db:
-
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
+            mock_audio_data = canonical_audio[48000]  # 1 second
+            mock_sf.read.return_value = (mock_audio_data, sample_rate)
 
+            with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
                 mock_get_db.return_value.__enter__.return_value = test_db
 
                 with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
@@ -368,35 +456,34 @@ class TestErrorScenarios:
     """Test error scenarios in spectrogram task duration processing."""
 
     def test_database_error_during_duration_update(
-        self, test_db, test_recording_no_duration, mock_celery_task, mock_minio_operations
+        self,
+        test_db,
+        test_recording_no_duration,
+        mock_celery_task,
+        mock_minio_operations,
+        canonical_audio,
     ):
         """Test handling of database errors during duration update."""
         recording_id = test_recording_no_duration.id
 
-        with patch("app.tasks.spectrogram_tasks.librosa") as mock_librosa:
-            mock_audio_data = np.random.random(44100)
+        with patch("app.tasks.spectrogram_tasks.sf") as mock_sf:
+            mock_audio_data = canonical_audio[44100]
             mock_sample_rate = 44100
-            mock_librosa.load.return_value = (mock_audio_data, mock_sample_rate)
-
-            with patch("tempfile.NamedTemporaryFile") as mock_temp:
-                mock_file = MagicMock()
-                mock_file.name = "/tmp/test_audio.mp3"
-                mock_file.__enter__.return_value = mock_file
-                mock_temp.return_value = mock_file
-
-                # Mock database session with commit error
-                with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
-                    mock_db = MagicMock()
-                    mock_db.commit.side_effect = Exception("Database commit failed")
-                    mock_get_db.return_value.__enter__.return_value = mock_db
-
-                    with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
-                        mock_spec = MagicMock()
-                        MockSpectrogram.return_value = mock_spec
-
-                        # Task should handle database errors
-                        with pytest.raises(Exception):
-                            generate_spectrogram_task(recording_id)
+            mock_sf.read.return_value = (mock_audio_data, mock_sample_rate)
+
+            # Mock database session with commit error
+            with patch("app.tasks.spectrogram_tasks.get_db_session") as mock_get_db:
+                mock_db = MagicMock()
+                mock_db.commit.side_effect = Exception("Database commit failed")
+                mock_get_db.return_value.__enter__.return_value = mock_db
+
+                with patch("app.tasks.spectrogram_tasks.Spectrogram") as MockSpectrogram:
+                    mock_spec = MagicMock()
+                    MockSpectrogram.return_value = mock_spec
+
+                    # Task should handle database errors
+                    with pytest.raises(Exception):
+                        generate_spectrogram_task(recording_id)
 
     def test_minio_download_failure(self, test_db, test_recording, mock_celery_task):
         """Test handling of MinIO download failures."""
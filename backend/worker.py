@@ -3,6 +3,7 @@
 Celery worker entry point for BSMarker spectrogram processing.
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
@@ -10,15 +11,26 @@ from pathlib import Path
 # Add the app directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app.core.celery_app import celery_app
+from app.core.celery_app import celery_app  # noqa: E402
+from celery.signals import setup_logging  # noqa: E402
 
-if __name__ == "__main__":
-    # Set up proper logging
-    import logging
 
+@setup_logging.connect
+def configure_worker_logging(loglevel=None, logfile=None, format=None, **kwargs):
+    """
+    Configure logging once in the main worker process.
+
+    Handling this signal stops Celery from reconfiguring the root logger itself;
+    prefork children inherit these handlers instead of setting them up again.
+    The worker's --loglevel and --logfile options are passed through the signal.
+    """
     logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        level=loglevel or logging.INFO,
+        filename=logfile or None,
+        format=format or "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+
+if __name__ == "__main__":
     # Start worker
     celery_app.start()
@@ -24,37 +24,118 @@ Version: 2.0.0 (Enhanced with port management)
 
 import argparse
 import atexit
+import hashlib
+import importlib.util
 import os
+import select
+import shutil
 import signal
 import socket
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# psutil will be imported later after checking if it's available
+psutil = None
+_proc_net_connections = None
+
+
+def _load_psutil():
+    """Import psutil into module scope; returns False if it is not installed"""
+    global psutil, _proc_net_connections, _listener_cache
+    try:
+        import psutil as _psutil
+    except ImportError:
+        return False
+    psutil = _psutil
+    # Any snapshot taken without psutil is empty, so don't let it be reused
+    _listener_cache = (float("-inf"), {})
+    # net_connections() superseded connections() in psutil 6.0
+    _proc_net_connections = (
+        getattr(psutil.Process, "net_connections", None) or psutil.Process.connections
+    )
+    return True
+
+
+_load_psutil()
 
 # Global variables for process tracking
 VERSION = "2.0.0"
 FRONTEND_PORT = 3456
 BACKEND_PORT = 8123
+POSTGRES_PORT = 5432
+REDIS_PORT = 6379
+# Probe a literal address: "localhost" costs a resolver lookup and may resolve to ::1 first
+LOOPBACK = "127.0.0.1"
 PID_FILE = Path(".bsmarker.pid")
 running_processes = []
+_listener_cache = (float("-inf"), {})
+
+# Creates the schema and the default admin user; run with the backend venv's python and
+# backend/.env already in its environment
+_MIGRATION_SCRIPT = """
+import sys
+import os
+# Add backend directory to path
+backend_path = os.path.join(os.getcwd(), 'backend')
+sys.path.insert(0, backend_path)
+
+from app.db.database import engine, Base
+from app.models import user, project, recording, spectrogram, annotation
+
+print("Creating database tables...")
+Base.metadata.create_all(bind=engine)
+print("✓ Database tables created")
+
+# Create admin user
+from app.db.database import SessionLocal
+from app.models.user import User
+from app.core.security import get_password_hash
+
+db = SessionLocal()
+try:
+    admin = db.query(User).filter(User.email == "admin@bsmarker.com").first()
+    if not admin:
+        admin = User(
+            email="admin@bsmarker.com",
+            username="admin",
+            hashed_password=get_password_hash("admin123"),
+            full_name="Administrator",
+            is_active=True,
+            is_admin=True
+        )
+        db.add(admin)
+        db.commit()
+        print("✓ Admin user created (admin@bsmarker.com / admin123)")
+    else:
+        print("✓ Admin user already exists")
+finally:
+    db.close()
+"""
 
 
-def cleanup_on_exit():
+def cleanup_on_exit(listeners=None):
     """Cleanup function called on exit"""
     print("\n🧹 Cleaning up resources...")
 
-    # Kill tracked processes
+    # Signal every tracked process group first, then wait on all of them against one
+    # shared deadline so slow children don't stack their timeouts. Each child leads its
+    # own session, so the signal also reaches uvicorn reloaders and node grandchildren.
     for proc in running_processes:
         try:
             if proc.poll() is None:  # Process is still running
-                proc.terminate()
-                proc.wait(timeout=5)
+                os.killpg(proc.pid, signal.SIGTERM)
+        except (OSError, AttributeError):
+            pass
+
+    deadline = time.monotonic() + 5
+    for proc in running_processes:
+        try:
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
         except (subprocess.TimeoutExpired, AttributeError):
             try:
-                proc.kill()
+                os.killpg(proc.pid, signal.SIGKILL)
             except:
                 pass
 
@@ -63,8 +144,15 @@ def cleanup_on_exit():
         PID_FILE.unlink()
 
     # Kill any remaining processes on our ports
+    if listeners is None:
+        listeners = snapshot_listeners()
+    unowned = [port for port in (FRONTEND_PORT, BACKEND_PORT) if port not in listeners]
+    in_use = probe_ports(unowned) if unowned else {}
     for port in [FRONTEND_PORT, BACKEND_PORT]:
-        kill_process_on_port(port, silent=True)
+        if port in listeners:
+            kill_process_on_port(port, silent=True, proc=listeners[port])
+        elif in_use.get(port):
+            kill_process_on_port(port, silent=True)
 
     print("✓ Cleanup complete")
 
@@ -76,46 +164,242 @@ def register_cleanup():
     signal.signal(signal.SIGTERM, lambda sig, frame: sys.exit(0))
 
 
-def is_port_in_use(port):
+def is_port_in_use(port, timeout=0.1):
     """Check if a port is already in use"""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        result = sock.connect_ex(("localhost", port))
+        sock.settimeout(timeout)
+        result = sock.connect_ex((LOOPBACK, port))
         return result == 0
 
 
-def find_process_on_port(port):
-    """Find process using a specific port"""
+def probe_ports(ports):
+    """Check several ports concurrently; returns {port: in_use}"""
+    ports = list(ports)
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        return dict(zip(ports, executor.map(is_port_in_use, ports)))
+
+
+def _open_exit_poller(*procs):
+    """Return a poll object that wakes when any of procs exits, plus the pidfds to close
+
+    Returns (None, []) where pidfds are unavailable.
+    """
+    if not procs or not hasattr(os, "pidfd_open"):
+        return None, []
+    pidfds = []
     try:
-        import psutil
+        for proc in procs:
+            pidfds.append(os.pidfd_open(proc.pid))
+    except OSError:
+        _close_fds(pidfds)
+        return None, []
+    poller = select.poll()
+    for pidfd in pidfds:
+        poller.register(pidfd, select.POLLIN)
+    return poller, pidfds
+
+
+def _close_fds(fds):
+    """Close raw file descriptors opened by _open_exit_poller"""
+    for fd in fds:
+        os.close(fd)
+
+
+def wait_for_any_exit(procs):
+    """Block until at least one of procs exits, without waking up in between"""
+    poller, pidfds = _open_exit_poller(*procs)
+    if poller is not None:
+        try:
+            poller.poll()
+        finally:
+            _close_fds(pidfds)
+        return
 
-        for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-            try:
-                # Use net_connections() to avoid deprecation warning
-                connections = (
-                    proc.net_connections()
-                    if hasattr(proc, "net_connections")
-                    else proc.connections()
+    if hasattr(select, "kqueue"):
+        # macOS/BSD: the kernel reports child exit through EVFILT_PROC
+        kq = select.kqueue()
+        try:
+            changes = [
+                select.kevent(
+                    proc.pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD,
+                    fflags=select.KQ_NOTE_EXIT,
                 )
-                for conn in connections:
-                    if conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
-                        return proc
+                for proc in procs
+            ]
+            kq.control(changes, 1, None)
+        except ProcessLookupError:
+            pass  # One of them is already gone
+        finally:
+            kq.close()
+        return
+
+    while all(proc.poll() is None for proc in procs):
+        time.sleep(1)
+
+
+def wait_for_port(port, timeout, interval=0.05, proc=None):
+    """Wait until something accepts connections on a port
+
+    Returns False on timeout, or as soon as proc (if given) exits.
+    """
+    deadline = time.monotonic() + timeout
+    poller, pidfds = _open_exit_poller(proc) if proc is not None else (None, [])
+    try:
+        while proc is None or proc.poll() is None:
+            try:
+                with socket.create_connection((LOOPBACK, port), timeout=interval):
+                    return True
+            except OSError:
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if poller is not None:
+                # Sleeps like time.sleep, but returns the moment the child dies
+                poller.poll(min(interval, remaining) * 1000)
+            else:
+                time.sleep(min(interval, remaining))
+        return False
+    finally:
+        _close_fds(pidfds)
+
+
+def wait_for_ports_released(ports, timeout=5, interval=0.05):
+    """Wait until nothing accepts connections on any of ports; returns False on timeout"""
+    deadline = time.monotonic() + timeout
+    pending = list(ports)
+    while True:
+        pending = [port for port in pending if is_port_in_use(port)]
+        if not pending:
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+
+
+def snapshot_listeners(max_age=0.5):
+    """Map every listening TCP port to its owning process in a single pass
+
+    Snapshots younger than max_age seconds are reused, so back-to-back checks in one run
+    share a single walk of the socket table.
+    """
+    global _listener_cache
+    taken_at, listeners = _listener_cache
+    if time.monotonic() - taken_at < max_age:
+        return listeners
+
+    listeners = _scan_listeners()
+    _listener_cache = (time.monotonic(), listeners)
+    return listeners
+
+
+def _scan_listeners():
+    """Walk the socket table for snapshot_listeners"""
+    if psutil is None:
+        # Owners are unknown; callers fall back to connect probes and /proc or lsof
+        return {}
+
+    listeners = {}
+    try:
+        connections = psutil.net_connections(kind="tcp")
+    except psutil.AccessDenied:
+        # macOS only lets root list system-wide sockets; walk our visible processes instead
+        for proc in psutil.process_iter():
+            try:
+                for conn in _proc_net_connections(proc):
+                    if conn.status == psutil.CONN_LISTEN:
+                        listeners.setdefault(conn.laddr.port, proc)
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
-    except ImportError:
-        print("⚠️  psutil not available, cannot identify processes on ports")
-        return None
-    except:
-        pass
-    return None
+        return listeners
 
+    for conn in connections:
+        if conn.status == psutil.CONN_LISTEN and conn.pid:
+            try:
+                listeners.setdefault(conn.laddr.port, psutil.Process(conn.pid))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    return listeners
 
-def kill_process_on_port(port, silent=False):
+
+def find_process_on_port(port):
+    """Find process using a specific port"""
+    return snapshot_listeners().get(port)
+
+
+def _pids_listening_on(port):
+    """Find PIDs holding a listening TCP socket on port by reading /proc (Linux only)"""
+    inodes = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f)  # Header
+                for line in f:
+                    fields = line.split()
+                    # fields[1] is "ADDR:PORT" in hex, fields[3] the state (0A = LISTEN)
+                    if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        inodes.add(fields[9])
+        except OSError:
+            continue
+    if not inodes:
+        return []
+
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    pids = []
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            fds = os.listdir(f"/proc/{pid}/fd")
+        except OSError:
+            continue
+        for fd in fds:
+            try:
+                if os.readlink(f"/proc/{pid}/fd/{fd}") in targets:
+                    pids.append(int(pid))
+                    break
+            except OSError:
+                continue
+    return pids
+
+
+def kill_process_on_port(port, silent=False, proc=None):
     """Kill process running on a specific port"""
-    proc = find_process_on_port(port)
-    if proc:
+    if psutil is None:
+        if not silent:
+            print(f"  Warning: psutil not available, trying system kill...")
+        if sys.platform.startswith("linux"):
+            pids = _pids_listening_on(port)
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    continue
+                if not silent:
+                    print(f"  Killed process {pid} on port {port}")
+            return bool(pids)
+
+        # Fallback to lsof + kill for other Unix systems
         try:
-            import psutil
+            result = subprocess.run(["lsof", "-ti", f":{port}"], capture_output=True, text=True)
+            if result.returncode == 0:
+                pids = result.stdout.strip().split("\n")
+                for pid in pids:
+                    if pid:
+                        subprocess.run(["kill", "-TERM", pid], check=True)
+                        if not silent:
+                            print(f"  Killed process {pid} on port {port}")
+                return True
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            if not silent:
+                print(f"  Warning: Could not kill process on port {port}")
+        return False
 
+    if proc is None:
+        proc = find_process_on_port(port)
+    if proc:
+        try:
             if not silent:
                 print(f"  Killing process {proc.pid} ({proc.name()}) on port {port}")
             proc.terminate()
@@ -127,59 +411,48 @@ def kill_process_on_port(port, silent=False):
                 return True
             except:
                 pass
-        except ImportError:
-            if not silent:
-                print(f"  Warning: psutil not available, trying system kill...")
-            # Fallback to lsof + kill for Unix systems
-            try:
-                result = subprocess.run(["lsof", "-ti", f":{port}"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    pids = result.stdout.strip().split("\n")
-                    for pid in pids:
-                        if pid:
-                            subprocess.run(["kill", "-TERM", pid], check=True)
-                            if not silent:
-                                print(f"  Killed process {pid} on port {port}")
-                    return True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                if not silent:
-                    print(f"  Warning: Could not kill process on port {port}")
-            return False
         except Exception as e:
             if not silent:
                 print(f"  Warning: Could not kill process on port {port}: {e}")
     return False
 
 
-def check_and_handle_ports(force=False):
+def check_and_handle_ports(force=False, listeners=None):
     """Check ports and handle conflicts"""
     ports_to_check = {FRONTEND_PORT: "Frontend (React)", BACKEND_PORT: "Backend (FastAPI)"}
 
+    if listeners is None:
+        listeners = snapshot_listeners()
+
+    # Only ports with no known owner need a connect probe
+    unowned = [port for port in ports_to_check if port not in listeners]
+    in_use = probe_ports(unowned) if unowned else {}
+
     conflicts = []
     for port, service in ports_to_check.items():
-        if is_port_in_use(port):
-            proc = find_process_on_port(port)
+        proc = listeners.get(port)
+        if proc or in_use.get(port):
             proc_info = f" (PID: {proc.pid}, {proc.name()})" if proc else ""
-            conflicts.append((port, service, proc_info))
+            conflicts.append((port, service, proc, proc_info))
 
     if not conflicts:
         return True
 
     print(f"\n⚠️  Port conflicts detected:")
-    for port, service, proc_info in conflicts:
+    for port, service, _, proc_info in conflicts:
         print(f"  • Port {port} ({service}) is in use{proc_info}")
 
     if force:
         print(f"\n🔧 Force flag enabled - killing conflicting processes...")
         all_killed = True
-        for port, service, _ in conflicts:
-            if not kill_process_on_port(port):
+        for port, service, proc, _ in conflicts:
+            if not kill_process_on_port(port, proc=proc):
                 print(f"  ❌ Failed to kill process on port {port}")
                 all_killed = False
 
         if all_killed:
             print("✓ All conflicting processes terminated")
-            time.sleep(2)  # Give ports time to be released
+            wait_for_ports_released([port for port, *_ in conflicts])
             return True
         else:
             return False
@@ -194,13 +467,13 @@ def check_and_handle_ports(force=False):
     if choice in ["y", "yes"]:
         print(f"\n🔧 Terminating conflicting processes...")
         all_killed = True
-        for port, service, _ in conflicts:
-            if not kill_process_on_port(port):
+        for port, service, proc, _ in conflicts:
+            if not kill_process_on_port(port, proc=proc):
                 all_killed = False
 
         if all_killed:
             print("✓ All conflicting processes terminated")
-            time.sleep(2)  # Give ports time to be released
+            wait_for_ports_released([port for port, *_ in conflicts])
             return True
         else:
             print("❌ Some processes could not be terminated")
@@ -213,47 +486,83 @@ def check_and_handle_ports(force=False):
 
 def check_existing_instance():
     """Check if BSMarker is already running"""
-    if not PID_FILE.exists():
+    # Opening the file doubles as the existence check for the common no-instance case
+    try:
+        pid_text = PID_FILE.read_text()
+    except FileNotFoundError:
         return False
 
     try:
-        import psutil
-
-        pid = int(PID_FILE.read_text().strip())
-        if psutil.pid_exists(pid):
-            proc = psutil.Process(pid)
-            if "python" in proc.name().lower() and "run_local.py" in " ".join(proc.cmdline()):
-                return pid
-    except ImportError:
-        print("⚠️  psutil not available, cannot check existing instances")
-        return False
-    except (ValueError, psutil.NoSuchProcess, psutil.AccessDenied):
-        pass
+        pid = int(pid_text.strip())
+        os.kill(pid, 0)
+    except (ValueError, OSError):
+        pid = None
+
+    if pid is not None:
+        cmdline_path = Path(f"/proc/{pid}/cmdline")
+        if sys.platform.startswith("linux"):
+            try:
+                if b"run_local.py" in cmdline_path.read_bytes().replace(b"\x00", b" "):
+                    return pid
+            except OSError:
+                pass
+        elif psutil is None:
+            print("⚠️  psutil not available, cannot check existing instances")
+            return False
+        else:
+            try:
+                proc = psutil.Process(pid)
+                if "python" in proc.name().lower() and "run_local.py" in " ".join(proc.cmdline()):
+                    return pid
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
 
     # PID file exists but process doesn't - clean it up
-    PID_FILE.unlink()
+    PID_FILE.unlink(missing_ok=True)
     return False
 
 
+def wait_for_pid_exit(pid, timeout, interval=0.05):
+    """Wait for a (non-child) process to disappear; returns False on timeout"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass  # Still alive, just owned by someone else
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+
+
 def create_pid_file():
     """Create PID file to track this instance"""
     PID_FILE.write_text(str(os.getpid()))
 
 
-def show_status():
+def show_status(listeners=None):
     """Show current BSMarker status"""
     print("🎵 BSMarker Status Check")
     print("=" * 40)
 
     # Check if instance is running
     existing_pid = check_existing_instance()
+    if listeners is None:
+        listeners = snapshot_listeners()
+    unowned = [port for port in (FRONTEND_PORT, BACKEND_PORT) if port not in listeners]
+    in_use = {port: port in listeners for port in (FRONTEND_PORT, BACKEND_PORT)}
+    if unowned:
+        in_use.update(probe_ports(unowned))
     if existing_pid:
         print(f"✅ BSMarker is running (PID: {existing_pid})")
 
         # Check port status
         for port, service in [(FRONTEND_PORT, "Frontend"), (BACKEND_PORT, "Backend")]:
-            if is_port_in_use(port):
-                proc = find_process_on_port(port)
+            if in_use[port]:
+                proc = listeners.get(port)
                 proc_info = f" (PID: {proc.pid})" if proc else ""
                 print(f"  • {service}: Running on port {port}{proc_info}")
             else:
@@ -263,8 +572,8 @@ def show_status():
 
         # Check if ports are occupied by other processes
         for port, service in [(FRONTEND_PORT, "Frontend"), (BACKEND_PORT, "Backend")]:
-            if is_port_in_use(port):
-                proc = find_process_on_port(port)
+            if in_use[port]:
+                proc = listeners.get(port)
                 proc_info = f" (PID: {proc.pid}, {proc.name()})" if proc else ""
                 print(f"  ⚠️  Port {port} ({service}) occupied by other process{proc_info}")
 
@@ -277,39 +586,43 @@ def show_status():
 
 def check_python_requirements():
     """Check and install Python requirements for this script"""
-    try:
-        import psutil
-
+    if psutil is not None:
         return True
-    except ImportError:
-        print("📦 Installing required Python packages...")
-        try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r", "system_requirements.txt"],
-                check=True,
-                capture_output=True,
-            )
-            print("✓ Python packages installed")
-            # Re-import to make sure it's available
-            import psutil
 
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install Python packages")
-            print("   Try manually: pip3 install psutil")
-            return False
+    print("📦 Installing required Python packages...")
+    try:
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", "-r", "system_requirements.txt"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except subprocess.CalledProcessError:
+        print("❌ Failed to install Python packages")
+        print("   Try manually: pip3 install psutil")
+        return False
+    print("✓ Python packages installed")
+    # Bind the freshly installed module for the rest of the run
+    return _load_psutil()
 
 
 def check_requirements():
     """Check if required services are available"""
-    requirements = {"python3": "Python 3.11+", "psql": "PostgreSQL", "redis-cli": "Redis"}
+    requirements = {"psql": "PostgreSQL", "redis-cli": "Redis"}
 
     missing = []
+    # The backend venv is built from this interpreter, so check it rather than PATH's python3
+    if sys.version_info >= (3, 11):
+        print("✓ Python 3.11+ found")
+    else:
+        missing.append("Python 3.11+")
+        print("✗ Python 3.11+ not found")
+
     for cmd, name in requirements.items():
-        try:
-            subprocess.run([cmd, "--version"], capture_output=True, check=True)
+        # A PATH lookup is enough to know the tool exists; no need to exec it
+        if shutil.which(cmd):
             print(f"✓ {name} found")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        else:
             missing.append(name)
             print(f"✗ {name} not found")
 
@@ -331,8 +644,14 @@ def setup_database():
     print("\n📦 Setting up PostgreSQL database...")
 
     # Start PostgreSQL if not running
-    subprocess.run(["brew", "services", "start", "postgresql@15"], capture_output=True)
-    time.sleep(2)
+    if not is_port_in_use(POSTGRES_PORT):
+        subprocess.run(
+            ["brew", "services", "start", "postgresql@15"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if not wait_for_port(POSTGRES_PORT, timeout=15):
+            print(f"⚠️  PostgreSQL is not accepting connections on :{POSTGRES_PORT} yet")
 
     # Create database and user
     commands = [
@@ -341,15 +660,20 @@ def setup_database():
         "GRANT ALL PRIVILEGES ON DATABASE bsmarker_db TO bsmarker;",
     ]
 
-    for cmd in commands:
-        try:
-            subprocess.run(
-                ["psql", "-U", os.getenv("USER"), "-d", "postgres", "-c", cmd],
-                capture_output=True,
-                check=False,
-            )
-        except:
-            pass  # Ignore if already exists
+    # One psql session for all statements. They are fed as a script rather than a single -c
+    # string: -c runs as one implicit transaction, which CREATE DATABASE refuses, and one
+    # "already exists" error would abort the rest. Script mode just reports and continues.
+    try:
+        subprocess.run(
+            ["psql", "-U", os.getenv("USER"), "-d", "postgres", "-f", "-"],
+            input="\n".join(commands),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=False,
+        )
+    except:
+        pass  # Ignore if already exists
 
     print("✓ Database configured")
 
@@ -357,9 +681,18 @@ def setup_database():
 def start_redis():
     """Start Redis server"""
     print("\n🔴 Starting Redis...")
-    subprocess.run(["brew", "services", "start", "redis"], capture_output=True)
-    time.sleep(2)
-    print("✓ Redis started")
+    if is_port_in_use(REDIS_PORT):
+        print("✓ Redis already running")
+        return
+    subprocess.run(
+        ["brew", "services", "start", "redis"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if wait_for_port(REDIS_PORT, timeout=15):
+        print("✓ Redis started")
+    else:
+        print(f"⚠️  Redis is not accepting connections on :{REDIS_PORT} yet")
 
 
 def setup_backend_env():
@@ -377,8 +710,29 @@ def setup_backend_env():
     pip_path = venv_path / "bin" / "pip"
     requirements_path = backend_path / "requirements.txt"
 
+    # Skip pip entirely when requirements.txt hasn't changed since the last install
+    requirements_hash = hashlib.sha256(requirements_path.read_bytes()).hexdigest()
+    marker_path = venv_path / ".bsmarker-req-hash"
+    if marker_path.exists() and marker_path.read_text() == requirements_hash:
+        print("✓ Dependencies up to date")
+        return venv_path
+
     print("📦 Installing Python dependencies...")
-    subprocess.run([str(pip_path), "install", "-r", str(requirements_path)], check=True)
+    # Prefer wheels over building sdists and let .pyc files be written lazily on import;
+    # pip's default per-user cache is already shared between venvs
+    subprocess.run(
+        [
+            str(pip_path),
+            "install",
+            "--prefer-binary",
+            "--no-compile",
+            "-r",
+            str(requirements_path),
+        ],
+        check=True,
+        env={**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"},
+    )
+    marker_path.write_text(requirements_hash)
     print("✓ Dependencies installed")
 
     return venv_path
@@ -397,12 +751,16 @@ def create_env_file():
 
     # Try to generate secure secrets
     try:
-        # Import the secret generator
-        sys.path.insert(0, str(Path("backend")))
-        from app.core.generate_secrets import generate_all_secrets, write_env_file
+        # Load the secret generator straight from its file; it only needs the stdlib, and this
+        # avoids putting backend/ on sys.path (and importing the app package) in the runner
+        spec = importlib.util.spec_from_file_location(
+            "generate_secrets", Path("backend/app/core/generate_secrets.py")
+        )
+        generate_secrets = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(generate_secrets)
 
         # Generate secure secrets for local development
-        secrets = generate_all_secrets()
+        secrets = generate_secrets.generate_all_secrets()
 
         # Override some values for local development
         secrets.update(
@@ -417,10 +775,10 @@ def create_env_file():
         )
 
         # Write the secure .env file
-        write_env_file(secrets, env_path)
+        generate_secrets.write_env_file(secrets, env_path)
         print("✓ Environment file created with secure secrets")
 
-    except ImportError:
+    except (ImportError, OSError):
         # Fallback to basic .env if generate_secrets not available
         env_content = """# BSMarker Local Development Environment
 # WARNING: Using fallback configuration with weak secrets
@@ -459,67 +817,48 @@ def start_minio():
     minio_cmd = ["minio", "server", str(minio_data), "--console-address", ":9001"]
 
     try:
-        subprocess.Popen(minio_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        subprocess.Popen(
+            minio_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False
+        )
         print("✓ MinIO started on :9000 (console: :9001)")
     except FileNotFoundError:
         print("⚠️  MinIO not found. Install with: brew install minio")
         print("   Continuing without file storage...")
 
 
+def read_env_file(env_path):
+    """Parse KEY=VALUE lines of a .env file, skipping comments and stripping quotes"""
+    env_vars = {}
+    if not env_path.exists():
+        return env_vars
+    for line in env_path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        env_vars[key.strip()] = value
+    return env_vars
+
+
 def run_migrations(venv_path):
     """Run database migrations"""
     print("\n🔄 Running database migrations...")
 
     python_path = venv_path / "bin" / "python"
 
-    # Create a simple migration script
-    migration_script = """
-import sys
-import os
-# Add backend directory to path
-backend_path = os.path.join(os.getcwd(), 'backend')
-sys.path.insert(0, backend_path)
-
-# Set environment variables from .env file
-from dotenv import load_dotenv
-load_dotenv('backend/.env')
-
-from app.db.database import engine, Base
-from app.models import user, project, recording, spectrogram, annotation
-
-print("Creating database tables...")
-Base.metadata.create_all(bind=engine)
-print("✓ Database tables created")
-
-# Create admin user
-from app.db.database import SessionLocal
-from app.models.user import User
-from app.core.security import get_password_hash
-
-db = SessionLocal()
-try:
-    admin = db.query(User).filter(User.email == "admin@bsmarker.com").first()
-    if not admin:
-        admin = User(
-            email="admin@bsmarker.com",
-            username="admin",
-            hashed_password=get_password_hash("admin123"),
-            full_name="Administrator",
-            is_active=True,
-            is_admin=True
-        )
-        db.add(admin)
-        db.commit()
-        print("✓ Admin user created (admin@bsmarker.com / admin123)")
-    else:
-        print("✓ Admin user already exists")
-finally:
-    db.close()
-"""
-
-    Path("migrate.py").write_text(migration_script)
-    subprocess.run([str(python_path), "migrate.py"], check=True, cwd=".")
-    Path("migrate.py").unlink()  # Clean up
+    # Feed the script on stdin so nothing has to be written to (and removed from) disk
+    subprocess.run(
+        [str(python_path), "-"],
+        input=_MIGRATION_SCRIPT,
+        text=True,
+        check=True,
+        cwd=".",
+        # Like load_dotenv, values already set in the environment win over the file
+        env={**read_env_file(Path("backend/.env")), **os.environ},
+    )
 
 
 def start_backend(venv_path):
@@ -546,18 +885,24 @@ def start_backend(venv_path):
             str(BACKEND_PORT),
         ],
         cwd="backend",
+        start_new_session=True,
+        # Our descriptors are non-inheritable (PEP 446), so skip the close-all-fds sweep
+        close_fds=False,
     )
 
     # Track the process for cleanup
     running_processes.append(backend_process)
 
-    # Wait a moment and check if it started successfully
-    time.sleep(2)
+    # Wait until it accepts connections, bailing out early if it dies
+    ready = wait_for_port(BACKEND_PORT, timeout=30, proc=backend_process)
     if backend_process.poll() is not None:
         print(f"❌ Backend failed to start (exit code: {backend_process.returncode})")
         return None
 
-    print(f"✓ Backend started successfully")
+    if ready:
+        print(f"✓ Backend started successfully")
+    else:
+        print("⚠️  Backend may not be fully ready yet, continuing...")
     return backend_process
 
 
@@ -566,38 +911,36 @@ def start_frontend():
     print(f"\n⚛️  Starting frontend on port {FRONTEND_PORT}...")
 
     frontend_dir = Path("frontend")
-    original_dir = Path.cwd()
 
-    try:
-        os.chdir(frontend_dir)
-
-        # Install npm dependencies if needed
-        if not Path("node_modules").exists():
-            print("📦 Installing npm dependencies...")
-            subprocess.run(["npm", "install"], check=True)
+    # Install npm dependencies if needed
+    if not os.path.isdir(frontend_dir / "node_modules"):
+        print("📦 Installing npm dependencies...")
+        subprocess.run(["npm", "install"], check=True, cwd=frontend_dir)
 
-        # Set environment variables for frontend
-        env = os.environ.copy()
-        env["PORT"] = str(FRONTEND_PORT)
-        env["REACT_APP_API_URL"] = f"http://localhost:{BACKEND_PORT}"
+    # Set environment variables for frontend
+    env = os.environ.copy()
+    env["PORT"] = str(FRONTEND_PORT)
+    env["REACT_APP_API_URL"] = f"http://localhost:{BACKEND_PORT}"
 
-        # Start development server
-        frontend_process = subprocess.Popen(["npm", "start"], env=env)
+    # Start development server
+    frontend_process = subprocess.Popen(
+        ["npm", "start"], cwd=frontend_dir, env=env, start_new_session=True, close_fds=False
+    )
 
-        # Track the process for cleanup
-        running_processes.append(frontend_process)
+    # Track the process for cleanup
+    running_processes.append(frontend_process)
 
-        # Wait a moment and check if it started successfully
-        time.sleep(3)
-        if frontend_process.poll() is not None:
-            print(f"❌ Frontend failed to start (exit code: {frontend_process.returncode})")
-            return None
+    # Wait until the dev server accepts connections, bailing out early if it dies
+    ready = wait_for_port(FRONTEND_PORT, timeout=60, proc=frontend_process)
+    if frontend_process.poll() is not None:
+        print(f"❌ Frontend failed to start (exit code: {frontend_process.returncode})")
+        return None
 
+    if ready:
         print(f"✓ Frontend started successfully")
-        return frontend_process
-
-    finally:
-        os.chdir(original_dir)
+    else:
+        print("⚠️  Frontend may not be fully ready yet, continuing...")
+    return frontend_process
 
 
 def main():
@@ -637,22 +980,26 @@ Examples:
         print("🛑 Stopping BSMarker...")
         existing_pid = check_existing_instance()
         if existing_pid:
-            try:
-                import psutil
-
-                proc = psutil.Process(existing_pid)
-                proc.terminate()
-                proc.wait(timeout=10)
-                print(f"✓ BSMarker stopped (PID: {existing_pid})")
-            except ImportError:
-                print("⚠️  psutil not available, trying OS kill command...")
+            if psutil is None:
+                print("⚠️  psutil not available, trying OS kill...")
                 try:
-                    subprocess.run(["kill", str(existing_pid)], check=True)
-                    print(f"✓ BSMarker stopped (PID: {existing_pid})")
-                except subprocess.CalledProcessError:
+                    os.kill(existing_pid, signal.SIGTERM)
+                    if wait_for_pid_exit(existing_pid, timeout=10):
+                        print(f"✓ BSMarker stopped (PID: {existing_pid})")
+                    else:
+                        print("⚠️  Process already stopped or unresponsive")
+                except ProcessLookupError:
+                    print("⚠️  Process already stopped or unresponsive")
+                except OSError:
                     print("❌ Failed to stop process")
-            except (psutil.NoSuchProcess, psutil.TimeoutExpired):
-                print("⚠️  Process already stopped or unresponsive")
+            else:
+                try:
+                    proc = psutil.Process(existing_pid)
+                    proc.terminate()
+                    proc.wait(timeout=10)
+                    print(f"✓ BSMarker stopped (PID: {existing_pid})")
+                except (psutil.NoSuchProcess, psutil.TimeoutExpired):
+                    print("⚠️  Process already stopped or unresponsive")
 
             # Clean up ports and PID file
             cleanup_on_exit()
@@ -674,6 +1021,10 @@ Examples:
         print("   Use --stop to stop it or --status to check status")
         sys.exit(1)
 
+    # Check requirements first, so a freshly installed psutil can identify port owners
+    if not check_requirements():
+        sys.exit(1)
+
     # Check and handle port conflicts
     if not check_and_handle_ports(force=args.force):
         sys.exit(1)
@@ -681,18 +1032,18 @@ Examples:
     # Create PID file to track this instance
     create_pid_file()
 
-    # Check requirements
-    if not check_requirements():
-        sys.exit(1)
-
     try:
-        # Setup services
-        setup_database()
-        start_redis()
-        start_minio()
-        create_env_file()
+        # Setup services; they are independent, so bring them up concurrently
+        # and only join before the migrations that need the database
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            services = [
+                executor.submit(service) for service in (setup_database, start_redis, start_minio)
+            ]
+            create_env_file()
+            venv_path = setup_backend_env()
+            for service in services:
+                service.result()
 
-        venv_path = setup_backend_env()
         run_migrations(venv_path)
 
         # Start backend
@@ -701,19 +1052,6 @@ Examples:
             print("❌ Failed to start backend")
             sys.exit(1)
 
-        # Wait for backend to be ready
-        print("⏳ Waiting for backend to be ready...")
-        max_wait = 30
-        wait_time = 0
-        while wait_time < max_wait:
-            if is_port_in_use(BACKEND_PORT):
-                print("✓ Backend is ready")
-                break
-            time.sleep(1)
-            wait_time += 1
-        else:
-            print("⚠️  Backend may not be fully ready yet, continuing...")
-
         # Start frontend
         frontend_proc = start_frontend()
         if not frontend_proc:
@@ -743,8 +1081,7 @@ Examples:
 
         # Wait for processes to finish (or interrupt)
         try:
-            while backend_proc.poll() is None and frontend_proc.poll() is None:
-                time.sleep(1)
+            wait_for_any_exit([backend_proc, frontend_proc])
         except KeyboardInterrupt:
             pass
 